@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import List
+from typing import Any, Dict, List
 from fastapi import APIRouter, Depends, HTTPException, status
 
 from backend.app.dependencies import (
@@ -18,7 +18,6 @@ from backend.app.schemas import (
     IndexResponse,
     IndexUpdate,
     SearchRequest,
-    SearchResponse,
 )
 from backend.app.services.document_service import DocumentService
 from backend.app.services.index_service import IndexService
@@ -28,13 +27,18 @@ router = APIRouter(prefix="/api")
 
 
 @router.get("/health")
-def health_check() -> dict:
+async def health_check() -> dict:
     return {"status": "ok"}
 
 
-@router.get("/indexes", response_model=List[IndexResponse])
-def list_indexes(index_service: IndexService = Depends(get_index_service)):
-    return index_service.list_indexes()
+# Read paths return repository dicts that already match the response
+# schemas, so response_model is disabled there to skip the second
+# validation pass; the annotations keep the handler signatures honest.
+@router.get("/indexes", response_model=None)
+async def list_indexes(
+    index_service: IndexService = Depends(get_index_service),
+) -> List[Dict[str, Any]]:
+    return await index_service.list_indexes()
 
 
 @router.post(
@@ -42,53 +46,55 @@ def list_indexes(index_service: IndexService = Depends(get_index_service)):
     response_model=IndexResponse,
     status_code=status.HTTP_201_CREATED,
 )
-def create_index(
+async def create_index(
     payload: IndexCreate,
     index_service: IndexService = Depends(get_index_service),
 ):
-    existing = index_service.get_index(payload.name)
-    if existing:
+    index = await index_service.create_index(payload)
+    if index is None:
         raise HTTPException(status_code=400, detail="Index already exists")
-    return index_service.create_index(payload.model_dump())
+    return index
 
 
-@router.get("/indexes/{name}", response_model=IndexResponse)
-def get_index(name: str, index_service: IndexService = Depends(get_index_service)):
-    index = index_service.get_index(name)
+@router.get("/indexes/{name}", response_model=None)
+async def get_index(
+    name: str, index_service: IndexService = Depends(get_index_service)
+) -> Dict[str, Any]:
+    index = await index_service.get_index(name)
     if not index:
         raise HTTPException(status_code=404, detail="Index not found")
     return index
 
 
 @router.put("/indexes/{name}", response_model=IndexResponse)
-def update_index(
+async def update_index(
     name: str,
     payload: IndexUpdate,
     index_service: IndexService = Depends(get_index_service),
 ):
-    if not index_service.get_index(name):
+    index = await index_service.update_index(name, payload)
+    if index is None:
         raise HTTPException(status_code=404, detail="Index not found")
-    return index_service.update_index(name, payload.model_dump(exclude_unset=True))
+    return index
 
 
 @router.delete("/indexes/{name}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_index(name: str, index_service: IndexService = Depends(get_index_service)):
-    if not index_service.get_index(name):
+async def delete_index(name: str, index_service: IndexService = Depends(get_index_service)):
+    if not await index_service.delete_index(name):
         raise HTTPException(status_code=404, detail="Index not found")
-    index_service.delete_index(name)
 
 
 # Document routes ---------------------------------------------------------
 
 @router.get(
     "/indexes/{name}/documents",
-    response_model=List[DocumentResponse],
+    response_model=None,
 )
-def list_documents(
+async def list_documents(
     name: str,
     document_service: DocumentService = Depends(get_document_service),
-):
-    return document_service.list_documents(name)
+) -> List[Dict[str, Any]]:
+    return await document_service.list_documents(name)
 
 
 @router.post(
@@ -96,12 +102,12 @@ def list_documents(
     response_model=DocumentResponse,
     status_code=status.HTTP_201_CREATED,
 )
-def create_document(
+async def create_document(
     name: str,
     payload: DocumentCreate,
     document_service: DocumentService = Depends(get_document_service),
 ):
-    return document_service.create_document(
+    return await document_service.create_document(
         index_name=name,
         content=payload.content,
         metadata=payload.metadata,
@@ -109,16 +115,32 @@ def create_document(
     )
 
 
+@router.post(
+    "/indexes/{name}/documents:bulk",
+    response_model=List[DocumentResponse],
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_documents_bulk(
+    name: str,
+    payload: List[DocumentCreate],
+    document_service: DocumentService = Depends(get_document_service),
+):
+    return await document_service.create_documents_bulk(
+        index_name=name,
+        payloads=payload,
+    )
+
+
 @router.get(
     "/indexes/{name}/documents/{doc_id}",
-    response_model=DocumentResponse,
+    response_model=None,
 )
-def get_document(
+async def get_document(
     name: str,
     doc_id: str,
     document_service: DocumentService = Depends(get_document_service),
-):
-    document = document_service.get_document(name, doc_id)
+) -> Dict[str, Any]:
+    document = await document_service.get_document(name, doc_id)
     if not document:
         raise HTTPException(status_code=404, detail="Document not found")
     return document
@@ -128,13 +150,13 @@ def get_document(
     "/indexes/{name}/documents/{doc_id}",
     response_model=DocumentResponse,
 )
-def update_document(
+async def update_document(
     name: str,
     doc_id: str,
     payload: DocumentUpdate,
     document_service: DocumentService = Depends(get_document_service),
 ):
-    document = document_service.update_document(
+    document = await document_service.update_document(
         index_name=name,
         doc_id=doc_id,
         content=payload.content,
@@ -150,25 +172,23 @@ def update_document(
     "/indexes/{name}/documents/{doc_id}",
     status_code=status.HTTP_204_NO_CONTENT,
 )
-def delete_document(
+async def delete_document(
     name: str,
     doc_id: str,
     document_service: DocumentService = Depends(get_document_service),
 ):
-    document = document_service.get_document(name, doc_id)
-    if not document:
+    if not await document_service.delete_document(name, doc_id):
         raise HTTPException(status_code=404, detail="Document not found")
-    document_service.delete_document(name, doc_id)
 
 
 # Search ------------------------------------------------------------------
 
-@router.post("/search", response_model=SearchResponse)
-def rag_search(
+@router.post("/search", response_model=None)
+async def rag_search(
     payload: SearchRequest,
     search_service: SearchService = Depends(get_search_service),
-):
-    result = search_service.rag_search(
+) -> Dict[str, Any]:
+    result = await search_service.rag_search(
         index_name=payload.index_name,
         query=payload.query,
         keywords=payload.keywords,
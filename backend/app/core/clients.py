@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections import OrderedDict
 from typing import List, Optional
 import httpx
 
+_LIMITS = httpx.Limits(max_keepalive_connections=100, max_connections=200)
+
 
 class EmbeddingClient:
     """Simple client for OpenAI-compatible embedding endpoints."""
@@ -15,26 +19,111 @@ class EmbeddingClient:
         base_url: str,
         api_key: Optional[str] = None,
         timeout: float = 30.0,
+        max_concurrency: int = 32,
+        batch_size: int = 128,
+        cache_size: int = 10_000,
     ) -> None:
         self.model = model
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
         self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        self.batch_size = batch_size
+        self._cache: OrderedDict[str, List[float]] = OrderedDict()
+        self._cache_size = cache_size
+        headers = {"Content-Type": "application/json"}
+        if api_key:
+            headers["Authorization"] = f"Bearer {api_key}"
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=headers,
+            timeout=timeout,
+            limits=_LIMITS,
+        )
 
-    def embed(self, text: str) -> List[float]:
+    async def embed(self, text: str) -> List[float]:
+        cached = self._cache_get(text)
+        if cached is not None:
+            return cached
         payload = {"model": self.model, "input": text}
-        headers = {"Content-Type": "application/json"}
-        if self.api_key:
-            headers["Authorization"] = f"Bearer {self.api_key}"
-        url = f"{self.base_url}/embeddings"
-        response = httpx.post(url, json=payload, headers=headers, timeout=self.timeout)
+        response = await self._client.post("/embeddings", json=payload)
         response.raise_for_status()
         data = response.json()
         embedding = data["data"][0]["embedding"]
         if not isinstance(embedding, list):
             raise ValueError("Embedding response missing embedding list")
+        self._cache_put(text, embedding)
+        return embedding
+
+    def _cache_get(self, text: str) -> Optional[List[float]]:
+        embedding = self._cache.get(text)
+        if embedding is not None:
+            self._cache.move_to_end(text)
         return embedding
 
+    def _cache_put(self, text: str, embedding: List[float]) -> None:
+        self._cache[text] = embedding
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+
+    async def embed_many(self, texts: List[str]) -> List[List[float]]:
+        """Embed a batch of texts with concurrent batched API round-trips.
+
+        Texts are sorted by length so each batch packs similar-sized inputs,
+        then the batches are fired concurrently under the shared semaphore.
+        Falls back to bounded-concurrency per-item requests when the server
+        rejects array inputs.
+        """
+        if not texts:
+            return []
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]), reverse=True)
+        batches = [
+            order[start:start + self.batch_size]
+            for start in range(0, len(order), self.batch_size)
+        ]
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def _embed_batch(indices: List[int]) -> List[List[float]]:
+            async with semaphore:
+                return await self._post_batch([texts[i] for i in indices])
+
+        try:
+            results = await asyncio.gather(*(_embed_batch(batch) for batch in batches))
+        except httpx.HTTPStatusError as exc:
+            if exc.response.status_code >= 500:
+                raise
+            return await self._embed_many_concurrent(texts)
+        embeddings: List[Optional[List[float]]] = [None] * len(texts)
+        for indices, batch_embeddings in zip(batches, results):
+            for index, embedding in zip(indices, batch_embeddings):
+                embeddings[index] = embedding
+        return embeddings  # type: ignore[return-value]
+
+    async def _post_batch(self, batch: List[str]) -> List[List[float]]:
+        """POST one embedding batch and return vectors in input order."""
+        payload = {"model": self.model, "input": batch}
+        response = await self._client.post("/embeddings", json=payload)
+        response.raise_for_status()
+        data = response.json()
+        rows = sorted(data["data"], key=lambda row: row.get("index", 0))
+        embeddings = [row["embedding"] for row in rows]
+        if len(embeddings) != len(batch):
+            raise ValueError("Embedding response size does not match input batch")
+        return embeddings
+
+    async def _embed_many_concurrent(self, texts: List[str]) -> List[List[float]]:
+        """Dispatch per-item embedding calls concurrently over the shared pool."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def _embed_one(text: str) -> List[float]:
+            async with semaphore:
+                return await self.embed(text)
+
+        return list(await asyncio.gather(*(_embed_one(text) for text in texts)))
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
 
 class ChatClient:
     """Client for OpenAI-compatible chat completions endpoints."""
@@ -54,8 +143,17 @@ class ChatClient:
         self.temperature = temperature
         self.max_tokens = max_tokens
         self.timeout = timeout
+        headers = {"Content-Type": "application/json"}
+        if api_key:
+            headers["Authorization"] = f"Bearer {api_key}"
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=headers,
+            timeout=timeout,
+            limits=_LIMITS,
+        )
 
-    def complete(self, system_prompt: str, user_prompt: str) -> str:
+    async def complete(self, system_prompt: str, user_prompt: str) -> str:
         payload = {
             "model": self.model,
             "temperature": self.temperature,
@@ -65,11 +163,10 @@ class ChatClient:
                 {"role": "user", "content": user_prompt},
             ],
         }
-        headers = {"Content-Type": "application/json"}
-        if self.api_key:
-            headers["Authorization"] = f"Bearer {self.api_key}"
-        url = f"{self.base_url}/chat/completions"
-        response = httpx.post(url, json=payload, headers=headers, timeout=self.timeout)
+        response = await self._client.post("/chat/completions", json=payload)
         response.raise_for_status()
         data = response.json()
         return data["choices"][0]["message"]["content"].strip()
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
@@ -2,23 +2,33 @@
 
 from __future__ import annotations
 
-from neo4j import Driver
+from neo4j import AsyncDriver, AsyncGraphDatabase
 from config import Config
 
-_driver: Driver | None = None
+_driver: AsyncDriver | None = None
 
 
-def get_driver() -> Driver:
-    """Return a shared Neo4j driver instance."""
+def get_driver() -> AsyncDriver:
+    """Return a shared async Neo4j driver instance."""
     global _driver
     if _driver is None:
-        _driver = Config.get_neo4j_driver()
+        _driver = AsyncGraphDatabase.driver(
+            Config.NEO4J_URI,
+            auth=(Config.NEO4J_USERNAME, Config.NEO4J_PASSWORD),
+            # Sized for concurrent ASGI workloads: the default 100-slot pool
+            # with a 60s acquisition timeout stalls requests long before the
+            # event loop saturates.
+            max_connection_pool_size=200,
+            connection_acquisition_timeout=5,
+            max_connection_lifetime=3600,
+            keep_alive=True,
+        )
     return _driver
 
 
-def close_driver() -> None:
+async def close_driver() -> None:
     """Close the shared Neo4j driver if it is open."""
     global _driver
     if _driver is not None:
-        _driver.close()
+        await _driver.close()
         _driver = None
@@ -23,6 +23,21 @@ class Settings:
     llm_api_key: str | None = ProjectConfig.OPENAI_API_KEY
     llm_temperature: float = ProjectConfig.LLM_TEMPERATURE
     llm_max_tokens: int = ProjectConfig.LLM_MAX_TOKENS
+    cors_allow_origins: tuple = tuple(
+        origin.strip()
+        for origin in ProjectConfig.CORS_ALLOW_ORIGINS.split(",")
+        if origin.strip()
+    )
+    effective_embedding_base_url: str | None = None
+    effective_llm_base_url: str | None = None
+
+    def __post_init__(self) -> None:
+        # Resolve the base-URL fallbacks once so request-time code reads a
+        # single attribute instead of re-evaluating the or-chain.
+        if self.effective_embedding_base_url is None:
+            self.effective_embedding_base_url = self.embedding_base_url or self.llm_base_url
+        if self.effective_llm_base_url is None:
+            self.effective_llm_base_url = self.llm_base_url or self.embedding_base_url
 
 
 @lru_cache
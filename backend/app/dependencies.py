@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from fastapi import Depends
 
 from backend.app.core.clients import ChatClient, EmbeddingClient
@@ -13,21 +15,31 @@ from backend.app.services.index_service import IndexService
 from backend.app.services.search_service import SearchService
 
 
-def get_repository() -> Neo4jRepository:
+@lru_cache(maxsize=1)
+def _build_repository() -> Neo4jRepository:
     settings = get_settings()
     driver = get_driver()
-    return Neo4jRepository(driver=driver, vector_index_name=settings.vector_index_name)
+    return Neo4jRepository(
+        driver=driver,
+        vector_index_name=settings.vector_index_name,
+        database=settings.neo4j_database,
+    )
+
+
+async def get_repository() -> Neo4jRepository:
+    return _build_repository()
 
 
-def get_index_service(
+async def get_index_service(
     repository: Neo4jRepository = Depends(get_repository),
 ) -> IndexService:
     return IndexService(repository)
 
 
-def get_embedder() -> EmbeddingClient:
+@lru_cache
+def _build_embedder() -> EmbeddingClient:
     settings = get_settings()
-    base_url = settings.embedding_base_url or settings.llm_base_url
+    base_url = settings.effective_embedding_base_url
     if not base_url:
         raise ValueError("Embedding base URL must be configured")
     return EmbeddingClient(
@@ -37,9 +49,14 @@ def get_embedder() -> EmbeddingClient:
     )
 
 
-def get_llm_client() -> ChatClient:
+async def get_embedder() -> EmbeddingClient:
+    return _build_embedder()
+
+
+@lru_cache
+def _build_llm_client() -> ChatClient:
     settings = get_settings()
-    base_url = settings.llm_base_url or settings.embedding_base_url
+    base_url = settings.effective_llm_base_url
     if not base_url:
         raise ValueError("LLM base URL must be configured")
     return ChatClient(
@@ -51,14 +68,18 @@ def get_llm_client() -> ChatClient:
     )
 
 
-def get_document_service(
+async def get_llm_client() -> ChatClient:
+    return _build_llm_client()
+
+
+async def get_document_service(
     repository: Neo4jRepository = Depends(get_repository),
     embedder: EmbeddingClient = Depends(get_embedder),
 ) -> DocumentService:
     return DocumentService(repository, embedder)
 
 
-def get_search_service(
+async def get_search_service(
     repository: Neo4jRepository = Depends(get_repository),
     embedder: EmbeddingClient = Depends(get_embedder),
     llm: ChatClient = Depends(get_llm_client),
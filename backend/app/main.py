@@ -4,23 +4,35 @@ from __future__ import annotations
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from backend.app.api.routes import router as api_router
 from backend.app.core.db import close_driver
+from backend.app.core.settings import get_settings
+from backend.app.dependencies import _build_repository
 
-app = FastAPI(title="Graph Pipeline Builder API", version="1.0.0")
+app = FastAPI(
+    title="Graph Pipeline Builder API",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+)
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_methods=["*"] ,
-    allow_headers=["*"] ,
+    allow_origins=get_settings().cors_allow_origins,
+    allow_methods=("GET", "POST", "PUT", "DELETE"),
+    allow_headers=("Content-Type", "Authorization"),
     allow_credentials=False,
 )
 
 app.include_router(api_router)
 
 
+@app.on_event("startup")
+async def startup_event() -> None:
+    await _build_repository().ensure_constraints()
+
+
 @app.on_event("shutdown")
 async def shutdown_event() -> None:
-    close_driver()
+    await close_driver()
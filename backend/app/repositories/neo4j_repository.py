@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-import json
-from datetime import datetime
+from array import array
 from typing import Any, Dict, List, Optional
 from uuid import uuid4
 
-from neo4j import Driver
+import orjson
+from neo4j import AsyncDriver
+from neo4j.exceptions import ClientError, ConstraintError
 from neo4j.graph import Node
 
 
@@ -16,101 +17,166 @@ class Neo4jRepository:
 
     INDEX_LABEL = "RAGIndex"
     DOCUMENT_LABEL = "RAGDocument"
+    FULLTEXT_INDEX_NAME = "doc_fts"
+    RRF_K = 60
 
-    def __init__(self, driver: Driver, vector_index_name: str) -> None:
+    # Read queries opt into Neo4j's parallel runtime (5.13+ Enterprise),
+    # which can spread large scans across cores. Support varies per server
+    # and per query shape, so each query string is probed once and the
+    # verdict cached process-wide; writes never use it.
+    _PARALLEL_PREFIX = "CYPHER runtime=parallel "
+    _parallel_ok: Dict[str, bool] = {}
+
+    def __init__(
+        self,
+        driver: AsyncDriver,
+        vector_index_name: str,
+        database: Optional[str] = None,
+    ) -> None:
         self.driver = driver
         self.vector_index_name = vector_index_name
-        self._ensure_constraints()
-
-    def _ensure_constraints(self) -> None:
-        with self.driver.session() as session:
-            session.run(
-                f"""
-                CREATE CONSTRAINT IF NOT EXISTS
-                FOR (index:{self.INDEX_LABEL})
-                REQUIRE index.name IS UNIQUE
-                """
-            )
-            session.run(
-                f"""
-                CREATE CONSTRAINT IF NOT EXISTS
-                FOR (doc:{self.DOCUMENT_LABEL})
-                REQUIRE doc.doc_id IS UNIQUE
-                """
-            )
+        self.database = database
+
+    async def _execute(self, query: str, **params: Any):
+        """Run a query through the driver's managed-transaction fast path."""
+        result = await self.driver.execute_query(
+            query, parameters_=params, database_=self.database
+        )
+        return result.records
+
+    async def _execute_read(self, query: str, **params: Any):
+        """Run a read-only query, preferring the parallel runtime if supported."""
+        if self._parallel_ok.get(query) is False:
+            return await self._execute(query, **params)
+        try:
+            records = await self._execute(self._PARALLEL_PREFIX + query, **params)
+        except ClientError:
+            # Community edition, pre-5.13 servers, or operators the parallel
+            # runtime can't handle: remember and stick to the default runtime
+            Neo4jRepository._parallel_ok[query] = False
+            return await self._execute(query, **params)
+        Neo4jRepository._parallel_ok[query] = True
+        return records
+
+    async def ensure_constraints(self) -> None:
+        await self._execute(
+            f"""
+            CREATE CONSTRAINT IF NOT EXISTS
+            FOR (index:{self.INDEX_LABEL})
+            REQUIRE index.name IS UNIQUE
+            """
+        )
+        await self._execute(
+            f"""
+            CREATE CONSTRAINT IF NOT EXISTS
+            FOR (doc:{self.DOCUMENT_LABEL})
+            REQUIRE doc.doc_id IS UNIQUE
+            """
+        )
+        await self._execute(
+            f"""
+            CREATE FULLTEXT INDEX {self.FULLTEXT_INDEX_NAME} IF NOT EXISTS
+            FOR (doc:{self.DOCUMENT_LABEL})
+            ON EACH [doc.content]
+            """
+        )
 
     # Index operations -----------------------------------------------------
-    def list_indexes(self) -> List[Dict[str, Any]]:
+    async def list_indexes(self) -> List[Dict[str, Any]]:
         query = (
             f"MATCH (i:{self.INDEX_LABEL}) "
             "RETURN i ORDER BY i.name"
         )
-        with self.driver.session() as session:
-            records = session.run(query)
-            return [record["i"] for record in records]
+        records = await self._execute_read(query)
+        return [self._props_to_dict(record["i"]) for record in records]
 
-    def get_index(self, name: str) -> Optional[Dict[str, Any]]:
+    async def get_index(self, name: str) -> Optional[Dict[str, Any]]:
         query = (
             f"MATCH (i:{self.INDEX_LABEL} {{name: $name}}) "
             "RETURN i"
         )
-        with self.driver.session() as session:
-            record = session.run(query, name=name).single()
-            return record["i"] if record else None
+        records = await self._execute_read(query, name=name)
+        return self._props_to_dict(records[0]["i"]) if records else None
 
-    def upsert_index(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        now = datetime.utcnow().isoformat()
+    async def create_index(
+        self,
+        name: str,
+        description: Optional[str] = None,
+        dimension: Optional[int] = None,
+        vector_index_name: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Create an index node atomically; return None when the name is taken."""
         query = (
-            f"MERGE (i:{self.INDEX_LABEL} {{name: $name}}) "
-            "ON CREATE SET i.created_at = $now "
+            f"CREATE (i:{self.INDEX_LABEL} {{name: $name}}) "
             "SET i.description = $description, "
             "    i.vector_index_name = $vector_index_name, "
             "    i.dimension = $dimension, "
-            "    i.updated_at = $now "
+            "    i.created_at = datetime(), "
+            "    i.updated_at = datetime() "
             "RETURN i"
         )
-        params = {
-            "name": data["name"],
-            "description": data.get("description"),
-            "vector_index_name": data.get("vector_index_name", self.vector_index_name),
-            "dimension": data.get("dimension"),
-            "now": now,
-        }
-        with self.driver.session() as session:
-            record = session.run(query, **params).single()
-            return record["i"]
-
-    def delete_index(self, name: str) -> None:
-        with self.driver.session() as session:
-            session.run(
-                f"MATCH (d:{self.DOCUMENT_LABEL} {{index_name: $name}}) DETACH DELETE d",
-                name=name,
-            )
-            session.run(
-                f"MATCH (i:{self.INDEX_LABEL} {{name: $name}}) DETACH DELETE i",
+        try:
+            records = await self._execute(
+                query,
                 name=name,
+                description=description,
+                vector_index_name=vector_index_name or self.vector_index_name,
+                dimension=dimension,
             )
+        except ConstraintError:
+            return None
+        return self._props_to_dict(records[0]["i"])
+
+    async def update_index(self, name: str, patch: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Patch an index node in one round-trip; return None when it is missing."""
+        query = (
+            f"MATCH (i:{self.INDEX_LABEL} {{name: $name}}) "
+            "SET i += $patch, i.updated_at = datetime() "
+            "RETURN i"
+        )
+        records = await self._execute(
+            query,
+            name=name,
+            patch={k: v for k, v in patch.items() if k != "name"},
+        )
+        return self._props_to_dict(records[0]["i"]) if records else None
+
+    async def delete_index(self, name: str) -> bool:
+        query = (
+            f"MATCH (i:{self.INDEX_LABEL} {{name: $name}}) "
+            f"OPTIONAL MATCH (d:{self.DOCUMENT_LABEL} {{index_name: $name}}) "
+            "DETACH DELETE d "
+            "WITH DISTINCT i "
+            "DETACH DELETE i "
+            "RETURN count(i) AS deleted"
+        )
+        records = await self._execute(query, name=name)
+        return bool(records and records[0]["deleted"])
 
     # Document operations --------------------------------------------------
-    def list_documents(self, index_name: str) -> List[Dict[str, Any]]:
+    async def list_documents(
+        self, index_name: str, limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         query = (
             f"MATCH (i:{self.INDEX_LABEL} {{name: $index_name}})-[:HAS_DOCUMENT]->(d:{self.DOCUMENT_LABEL}) "
             "RETURN d ORDER BY d.updated_at DESC"
         )
-        with self.driver.session() as session:
-            records = session.run(query, index_name=index_name)
-            return [self._node_to_dict(record["d"]) for record in records]
+        if limit is not None:
+            query += " LIMIT $limit"
+            records = await self._execute_read(query, index_name=index_name, limit=limit)
+        else:
+            records = await self._execute_read(query, index_name=index_name)
+        return [self._node_to_dict(record["d"]) for record in records]
 
-    def get_document(self, index_name: str, doc_id: str) -> Optional[Dict[str, Any]]:
+    async def get_document(self, index_name: str, doc_id: str) -> Optional[Dict[str, Any]]:
         query = (
             f"MATCH (i:{self.INDEX_LABEL} {{name: $index_name}})-[:HAS_DOCUMENT]->(d:{self.DOCUMENT_LABEL} {{doc_id: $doc_id}}) "
             "RETURN d"
         )
-        with self.driver.session() as session:
-            record = session.run(query, index_name=index_name, doc_id=doc_id).single()
-            return self._node_to_dict(record["d"]) if record else None
+        records = await self._execute_read(query, index_name=index_name, doc_id=doc_id)
+        return self._node_to_dict(records[0]["d"]) if records else None
 
-    def create_document(
+    async def create_document(
         self,
         index_name: str,
         content: str,
@@ -118,30 +184,54 @@ class Neo4jRepository:
         embedding: List[float],
     ) -> Dict[str, Any]:
         doc_id = str(uuid4())
-        now = datetime.utcnow().isoformat()
-        metadata_json = json.dumps(metadata or {})
         document_payload = {
             "doc_id": doc_id,
             "index_name": index_name,
             "content": content,
-            "metadata_json": metadata_json,
-            "embedding": embedding,
-            "created_at": now,
-            "updated_at": now,
+            "embedding": self._round_to_float32(embedding),
+            **self._pack_metadata(metadata),
         }
         query = (
             f"MATCH (i:{self.INDEX_LABEL} {{name: $index_name}}) "
             f"CREATE (i)-[:HAS_DOCUMENT]->(d:{self.DOCUMENT_LABEL}) "
-            "SET d = $payload "
+            "SET d = $payload, d.created_at = datetime(), d.updated_at = datetime() "
             "RETURN d"
         )
-        with self.driver.session() as session:
-            record = session.run(query, payload=document_payload, index_name=index_name).single()
-            if not record:
-                raise ValueError(f"Index {index_name} not found")
-            return self._node_to_dict(record["d"])
+        records = await self._execute(query, payload=document_payload, index_name=index_name)
+        if not records:
+            raise ValueError(f"Index {index_name} not found")
+        return self._node_to_dict(records[0]["d"])
 
-    def update_document(
+    async def create_documents_bulk(
+        self,
+        index_name: str,
+        documents: List[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """Create many documents under an index with a single UNWIND query."""
+        rows = [
+            {
+                "doc_id": str(uuid4()),
+                "index_name": index_name,
+                "content": doc["content"],
+                "embedding": self._round_to_float32(doc["embedding"]),
+                **self._pack_metadata(doc.get("metadata")),
+            }
+            for doc in documents
+        ]
+        query = (
+            f"MATCH (i:{self.INDEX_LABEL} {{name: $index_name}}) "
+            "UNWIND $rows AS row "
+            f"CREATE (i)-[:HAS_DOCUMENT]->(d:{self.DOCUMENT_LABEL}) "
+            "SET d = row, d.created_at = datetime(), d.updated_at = datetime() "
+            "RETURN d"
+        )
+        records = await self._execute(query, index_name=index_name, rows=rows)
+        created = [self._node_to_dict(record["d"]) for record in records]
+        if rows and not created:
+            raise ValueError(f"Index {index_name} not found")
+        return created
+
+    async def update_document(
         self,
         index_name: str,
         doc_id: str,
@@ -149,21 +239,29 @@ class Neo4jRepository:
         metadata: Optional[Dict[str, Any]],
         embedding: Optional[List[float]],
     ) -> Optional[Dict[str, Any]]:
-        assignments = ["d.updated_at = $now"]
+        assignments = ["d.updated_at = datetime()"]
         params: Dict[str, Any] = {
             "index_name": index_name,
             "doc_id": doc_id,
-            "now": datetime.utcnow().isoformat(),
         }
         if content is not None:
             assignments.append("d.content = $content")
             params["content"] = content
         if metadata is not None:
-            assignments.append("d.metadata_json = $metadata_json")
-            params["metadata_json"] = json.dumps(metadata)
+            # Null out stale meta_ properties so `+=` replaces the metadata
+            # instead of merging with whatever was stored before.
+            stale = await self._stale_metadata_keys(index_name, doc_id)
+            if stale is None:
+                return None
+            packed = self._pack_metadata(metadata)
+            assignments.append("d += $metadata_props")
+            params["metadata_props"] = {
+                **{key: None for key in stale if key not in packed},
+                **packed,
+            }
         if embedding is not None:
             assignments.append("d.embedding = $embedding")
-            params["embedding"] = embedding
+            params["embedding"] = self._round_to_float32(embedding)
         if len(assignments) == 1:  # Only updated_at
             set_clause = "SET " + assignments[0]
         else:
@@ -172,71 +270,200 @@ class Neo4jRepository:
             f"MATCH (i:{self.INDEX_LABEL} {{name: $index_name}})-[:HAS_DOCUMENT]->(d:{self.DOCUMENT_LABEL} {{doc_id: $doc_id}}) "
             f"{set_clause} RETURN d"
         )
-        with self.driver.session() as session:
-            record = session.run(query, **params).single()
-            return self._node_to_dict(record["d"]) if record else None
+        records = await self._execute(query, **params)
+        return self._node_to_dict(records[0]["d"]) if records else None
 
-    def delete_document(self, index_name: str, doc_id: str) -> None:
+    async def _stale_metadata_keys(
+        self, index_name: str, doc_id: str
+    ) -> Optional[List[str]]:
+        """Return the document's current meta_ property keys, None if missing."""
         query = (
             f"MATCH (i:{self.INDEX_LABEL} {{name: $index_name}})-[:HAS_DOCUMENT]->(d:{self.DOCUMENT_LABEL} {{doc_id: $doc_id}}) "
-            "DETACH DELETE d"
+            "RETURN [key IN keys(d) WHERE key STARTS WITH 'meta_'] AS stale"
         )
-        with self.driver.session() as session:
-            session.run(query, index_name=index_name, doc_id=doc_id)
+        records = await self._execute(query, index_name=index_name, doc_id=doc_id)
+        return list(records[0]["stale"]) if records else None
 
-    def vector_search(
+    async def delete_document(self, index_name: str, doc_id: str) -> bool:
+        query = (
+            f"MATCH (i:{self.INDEX_LABEL} {{name: $index_name}})-[:HAS_DOCUMENT]->(d:{self.DOCUMENT_LABEL} {{doc_id: $doc_id}}) "
+            "DETACH DELETE d "
+            "RETURN count(d) AS deleted"
+        )
+        records = await self._execute(query, index_name=index_name, doc_id=doc_id)
+        return bool(records and records[0]["deleted"])
+
+    async def vector_search(
         self,
         index_name: str,
         embedding: List[float],
         top_k: int,
         keywords: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]]:
+        """Search documents by vector similarity, optionally blended with keywords.
+
+        With keywords present, the vector and fulltext indexes are queried
+        side by side and their ranked lists merged with reciprocal rank
+        fusion, so lexical matches surface even when they fall outside the
+        top vector candidates.
+        """
         multiplier = max(3, top_k * 2)
+        # Blank-only keyword lists sanitize to an empty Lucene query, which
+        # queryNodes rejects — fall through to the pure vector branch
+        keyword_query = self._lucene_keyword_query(keywords) if keywords else ""
+        if keyword_query:
+            records = await self._hybrid_search(
+                index_name, embedding, top_k, keyword_query, multiplier
+            )
+        else:
+            query = (
+                "CALL db.index.vector.queryNodes($vector_index_name, $limit, $embedding) "
+                "YIELD node, score "
+                "WITH node, score "
+                "WHERE node.index_name = $index_name "
+                "RETURN node {.*, embedding: NULL} AS node, score "
+                "ORDER BY score DESC LIMIT $top_k"
+            )
+            records = await self._execute_read(
+                query,
+                vector_index_name=self.vector_index_name,
+                limit=multiplier,
+                embedding=embedding,
+                index_name=index_name,
+                top_k=top_k,
+            )
+        chunks = []
+        for record in records:
+            document = self._node_to_dict(record["node"])
+            chunks.append(
+                {
+                    "doc_id": document["doc_id"],
+                    "content": document["content"],
+                    "metadata": document["metadata"],
+                    "score": record["score"],
+                }
+            )
+        return chunks
+
+    @staticmethod
+    def _lucene_keyword_query(keywords: List[str]) -> str:
+        """Build a safe Lucene query from raw keywords.
+
+        Keywords come straight from API payloads; metacharacters like
+        ( ) : / ~ * " + would otherwise raise a Lucene parse error (and
+        silently degrade the search to the unranked fallback). Each
+        keyword is wrapped as a quoted phrase with embedded backslashes
+        and quotes escaped; blanks are dropped.
+        """
+        phrases = []
+        for keyword in keywords:
+            keyword = keyword.strip()
+            if keyword:
+                escaped = keyword.replace("\\", "\\\\").replace('"', '\\"')
+                phrases.append(f'"{escaped}"')
+        return " OR ".join(phrases)
+
+    async def _hybrid_search(
+        self,
+        index_name: str,
+        embedding: List[float],
+        top_k: int,
+        keyword_query: str,
+        limit: int,
+    ):
+        """Merge vector and fulltext rankings with reciprocal rank fusion."""
         query = (
-            "CALL db.index.vector.queryNodes($vector_index_name, $limit, $embedding) "
-            "YIELD node, score "
-            "WITH node, score "
-            "WHERE node.index_name = $index_name "
-            "  AND ($keywords IS NULL OR size($keywords) = 0 OR any(keyword IN $keywords "
-            "      WHERE toLower(node.content) CONTAINS toLower(keyword))) "
-            "RETURN node.doc_id AS doc_id, node.content AS content, node.metadata_json AS metadata_json, score "
-            "ORDER BY score DESC LIMIT $top_k"
-        )
-        params = {
-            "vector_index_name": self.vector_index_name,
-            "limit": multiplier,
-            "embedding": embedding,
-            "index_name": index_name,
-            "keywords": keywords,
-            "top_k": top_k,
-        }
-        with self.driver.session() as session:
-            result = session.run(query, **params)
-            chunks = []
-            for record in result:
-                metadata_json = record.get("metadata_json")
-                metadata = json.loads(metadata_json) if metadata_json else {}
-                chunks.append(
-                    {
-                        "doc_id": record["doc_id"],
-                        "content": record["content"],
-                        "metadata": metadata,
-                        "score": record["score"],
-                    }
-                )
-            return chunks
+            "CALL { "
+            "  CALL db.index.vector.queryNodes($vector_index_name, $limit, $embedding) "
+            "  YIELD node, score "
+            "  WITH node, score "
+            "  WHERE node.index_name = $index_name "
+            "  WITH node ORDER BY score DESC "
+            "  WITH collect(node) AS nodes "
+            "  UNWIND range(0, size(nodes) - 1) AS rank "
+            "  RETURN nodes[rank] AS node, rank "
+            "UNION ALL "
+            "  CALL db.index.fulltext.queryNodes($fulltext_index_name, $keyword_query) "
+            "  YIELD node, score "
+            "  WITH node, score "
+            "  WHERE node.index_name = $index_name "
+            "  WITH node, score ORDER BY score DESC LIMIT $limit "
+            "  WITH collect(node) AS nodes "
+            "  UNWIND range(0, size(nodes) - 1) AS rank "
+            "  RETURN nodes[rank] AS node, rank "
+            "} "
+            "WITH node, sum(1.0 / ($rrf_k + rank)) AS score "
+            "ORDER BY score DESC LIMIT $top_k "
+            "RETURN node {.*, embedding: NULL} AS node, score"
+        )
+        return await self._execute_read(
+            query,
+            vector_index_name=self.vector_index_name,
+            fulltext_index_name=self.FULLTEXT_INDEX_NAME,
+            keyword_query=keyword_query,
+            limit=limit,
+            embedding=embedding,
+            index_name=index_name,
+            rrf_k=self.RRF_K,
+            top_k=top_k,
+        )
 
     # ------------------------------------------------------------------
     # ------------------------------------------------------------------
+    _SCALAR_TYPES = (str, int, float, bool)
+    _META_PREFIX = "meta_"
+
+    @classmethod
+    def _pack_metadata(cls, metadata: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Split metadata into meta_-prefixed scalar properties plus a JSON rest.
+
+        Scalar values become native node properties (no serialization cost,
+        filterable server-side); anything nested stays JSON-encoded under
+        metadata_json. A None metadata_json entry clears any previous value.
+        """
+        props: Dict[str, Any] = {}
+        remainder: Dict[str, Any] = {}
+        for key, value in (metadata or {}).items():
+            if isinstance(value, cls._SCALAR_TYPES):
+                props[cls._META_PREFIX + key] = value
+            else:
+                remainder[key] = value
+        props["metadata_json"] = (
+            orjson.dumps(remainder).decode() if remainder else None
+        )
+        return props
+
+    @staticmethod
+    def _round_to_float32(embedding: Optional[List[float]]) -> Optional[List[float]]:
+        """Round embedding components to float32 precision before storage.
+
+        Neo4j's vector index operates on float32; rounding up front keeps
+        stored vectors consistent with what the index actually compares.
+        """
+        if embedding is None:
+            return None
+        return array("f", embedding).tolist()
+
     @staticmethod
-    def _node_to_dict(node: Node) -> Dict[str, Any]:
+    def _props_to_dict(node: Node) -> Dict[str, Any]:
+        """Convert node properties to plain values, stringifying temporals."""
         data = dict(node)
+        for key, value in data.items():
+            if hasattr(value, "iso_format"):
+                data[key] = value.iso_format()
+        return data
+
+    @classmethod
+    def _node_to_dict(cls, node: Node) -> Dict[str, Any]:
+        data = cls._props_to_dict(node)
+        metadata: Dict[str, Any] = {}
+        for key in [k for k in data if k.startswith(cls._META_PREFIX)]:
+            metadata[key[len(cls._META_PREFIX):]] = data.pop(key)
         metadata_json = data.pop("metadata_json", None)
         if metadata_json:
             try:
-                data["metadata"] = json.loads(metadata_json)
-            except json.JSONDecodeError:
-                data["metadata"] = {}
-        else:
-            data["metadata"] = {}
+                metadata.update(orjson.loads(metadata_json))
+            except orjson.JSONDecodeError:
+                pass
+        data["metadata"] = metadata
         return data
@@ -8,42 +8,59 @@ from typing import Dict, Any, List, Optional
 
 from backend.app.core.clients import EmbeddingClient
 from backend.app.repositories.neo4j_repository import Neo4jRepository
+from backend.app.schemas import DocumentCreate
 from backend.app.services.graph_builder_support import GraphBuilderSupport
-from kg_builder import EXAMPLE_SCHEMAS
+from kg_builder import SCHEMA_PRESETS
 
 logger = logging.getLogger(__name__)
 
+# Ingestion control flags callers may tuck into document metadata; their
+# presence is what forces a defensive copy before popping them out.
+_CONTROL_KEYS = ("build_kg", "schema_key", "perform_entity_resolution")
+
 
 class DocumentService:
     """Handles CRUD for RAG documents and orchestrates KG builder workflows."""
 
+    __slots__ = ("repository", "embedder", "_graph_builder_support")
+
     def __init__(self, repository: Neo4jRepository, embedder: EmbeddingClient) -> None:
         self.repository = repository
         self.embedder = embedder
-        self._graph_builder_support = GraphBuilderSupport(repository.driver)
+        # The builder stack is sync-only; GraphBuilderSupport brings its own
+        # sync driver rather than borrowing the repository's async one
+        self._graph_builder_support = GraphBuilderSupport()
 
-    def list_documents(self, index_name: str) -> List[Dict[str, Any]]:
-        return self.repository.list_documents(index_name)
+    async def list_documents(self, index_name: str) -> List[Dict[str, Any]]:
+        return await self.repository.list_documents(index_name)
 
-    def get_document(self, index_name: str, doc_id: str) -> Dict[str, Any] | None:
-        return self.repository.get_document(index_name, doc_id)
+    async def get_document(self, index_name: str, doc_id: str) -> Dict[str, Any] | None:
+        return await self.repository.get_document(index_name, doc_id)
 
-    def create_document(
+    async def create_document(
         self,
         index_name: str,
         content: str,
         metadata: Optional[Dict[str, Any]] = None,
         embedding: Optional[List[float]] = None,
     ) -> Dict[str, Any]:
-        metadata_copy = dict(metadata or {})
-        build_graph = bool(metadata_copy.pop("build_kg", False))
-        schema_key = metadata_copy.pop("schema_key", None)
-        perform_entity_resolution = metadata_copy.pop("perform_entity_resolution", True)
+        if metadata and any(key in metadata for key in _CONTROL_KEYS):
+            metadata_copy = dict(metadata)
+            build_graph = bool(metadata_copy.pop("build_kg", False))
+            schema_key = metadata_copy.pop("schema_key", None)
+            perform_entity_resolution = metadata_copy.pop("perform_entity_resolution", True)
+        else:
+            # Hot path: no control flags, so pass the caller's mapping
+            # through without copying it.
+            metadata_copy = metadata or {}
+            build_graph = False
+            schema_key = None
+            perform_entity_resolution = True
 
         builder_stats = None
         if build_graph:
             try:
-                builder_stats = self.build_graph_from_text(
+                builder_stats = await self.build_graph_from_text(
                     text=content,
                     metadata=metadata_copy,
                     schema_key=schema_key,
@@ -60,10 +77,31 @@ class DocumentService:
             except Exception as exc:  # pragma: no cover - defensive logging
                 logger.warning("Graph ingestion failed: %s", exc)
 
-        embedding_vec = embedding or self.embedder.embed(content)
-        return self.repository.create_document(index_name, content, metadata_copy, embedding_vec)
+        embedding_vec = embedding or await self.embedder.embed(content)
+        return await self.repository.create_document(index_name, content, metadata_copy, embedding_vec)
 
-    def update_document(
+    async def create_documents_bulk(
+        self,
+        index_name: str,
+        payloads: List[DocumentCreate],
+    ) -> List[Dict[str, Any]]:
+        """Create many documents at once, embedding missing vectors in one batch call."""
+        documents = [
+            {
+                "content": payload.content,
+                "metadata": dict(payload.metadata or {}),
+                "embedding": payload.embedding,
+            }
+            for payload in payloads
+        ]
+        missing = [doc for doc in documents if doc["embedding"] is None]
+        if missing:
+            embeddings = await self.embedder.embed_many([doc["content"] for doc in missing])
+            for doc, embedding in zip(missing, embeddings):
+                doc["embedding"] = embedding
+        return await self.repository.create_documents_bulk(index_name, documents)
+
+    async def update_document(
         self,
         index_name: str,
         doc_id: str,
@@ -73,13 +111,19 @@ class DocumentService:
     ) -> Dict[str, Any] | None:
         metadata_copy = None
         if metadata is not None:
-            metadata_copy = dict(metadata)
-            build_graph = bool(metadata_copy.pop("build_kg", False))
-            schema_key = metadata_copy.pop("schema_key", None)
-            perform_entity_resolution = metadata_copy.pop("perform_entity_resolution", True)
+            if any(key in metadata for key in _CONTROL_KEYS):
+                metadata_copy = dict(metadata)
+                build_graph = bool(metadata_copy.pop("build_kg", False))
+                schema_key = metadata_copy.pop("schema_key", None)
+                perform_entity_resolution = metadata_copy.pop("perform_entity_resolution", True)
+            else:
+                metadata_copy = metadata
+                build_graph = False
+                schema_key = None
+                perform_entity_resolution = True
             if build_graph and content:
                 try:
-                    builder_stats = self.build_graph_from_text(
+                    builder_stats = await self.build_graph_from_text(
                         text=content,
                         metadata=metadata_copy,
                         schema_key=schema_key,
@@ -97,17 +141,17 @@ class DocumentService:
                     logger.warning("Graph ingestion during update failed: %s", exc)
         embedding_vec = embedding
         if embedding_vec is None and content is not None:
-            embedding_vec = self.embedder.embed(content)
+            embedding_vec = await self.embedder.embed(content)
         payload_metadata = metadata_copy if metadata_copy is not None else metadata
-        return self.repository.update_document(index_name, doc_id, content, payload_metadata, embedding_vec)
+        return await self.repository.update_document(index_name, doc_id, content, payload_metadata, embedding_vec)
 
-    def delete_document(self, index_name: str, doc_id: str) -> None:
-        self.repository.delete_document(index_name, doc_id)
+    async def delete_document(self, index_name: str, doc_id: str) -> bool:
+        return await self.repository.delete_document(index_name, doc_id)
 
     # ------------------------------------------------------------------
     # Knowledge Graph builder helpers (example_kg_builder parity)
 
-    def build_graph_from_text(
+    async def build_graph_from_text(
         self,
         text: str,
         metadata: Optional[Dict[str, Any]] = None,
@@ -116,15 +160,14 @@ class DocumentService:
     ) -> Dict[str, Any]:
         """Ingest plain text into the knowledge graph using KnowledgeGraphBuilder."""
         builder = self._graph_builder_support.get_builder()
-        self._prepare_schema(builder, schema_key, sample_text=text)
-        return self._graph_builder_support.run(
-            builder.build_from_text,
+        await self._prepare_schema(builder, schema_key, sample_text=text)
+        return await builder.build_from_text(
             text=text,
             document_metadata=metadata or {},
             perform_entity_resolution=perform_entity_resolution,
         )
 
-    def build_graph_from_pdf(
+    async def build_graph_from_pdf(
         self,
         file_path: str | Path,
         metadata: Optional[Dict[str, Any]] = None,
@@ -133,29 +176,29 @@ class DocumentService:
     ) -> Dict[str, Any]:
         """Ingest PDF documents similarly to example_kg_builder."""
         builder = self._graph_builder_support.get_builder()
-        self._prepare_schema(builder, schema_key)
+        await self._prepare_schema(builder, schema_key)
         pdf_path = Path(file_path)
-        return self._graph_builder_support.run(
-            builder.build_from_pdf,
+        return await builder.build_from_pdf(
             file_path=pdf_path,
             document_metadata=metadata or {},
             perform_entity_resolution=perform_entity_resolution,
         )
 
-    def _prepare_schema(self, builder, schema_key: Optional[str], sample_text: Optional[str] = None) -> None:
+    async def _prepare_schema(self, builder, schema_key: Optional[str], sample_text: Optional[str] = None) -> None:
         """Apply schema strategies inspired by example_kg_builder."""
         if not schema_key:
             return
         if schema_key == "auto":
             if not sample_text:
                 raise ValueError("Sample text is required for automatic schema extraction")
-            self._graph_builder_support.run(builder.extract_schema_from_text, sample_text)
+            await builder.extract_schema_from_text(sample_text)
             return
-        preset = EXAMPLE_SCHEMAS.get(schema_key)
+        preset = SCHEMA_PRESETS.get(schema_key)
         if not preset:
             raise ValueError(f"Unknown schema preset: {schema_key}")
+        node_types, relationship_types, patterns = preset
         builder.define_schema(
-            node_types=preset["node_types"],
-            relationship_types=preset["relationship_types"],
-            patterns=preset["patterns"],
+            node_types=node_types,
+            relationship_types=relationship_types,
+            patterns=patterns,
         )
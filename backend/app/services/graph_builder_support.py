@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Any, Awaitable, Callable, Optional
+import threading
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Optional
 
 from config import Config
-from kg_builder import KnowledgeGraphBuilder
 from neo4j import Driver
-from neo4j_graphrag.embeddings import OpenAIEmbeddings
+
+if TYPE_CHECKING:
+    from kg_builder import KnowledgeGraphBuilder
 
 DEFAULT_CHUNK_SIZE = 4000
 DEFAULT_CHUNK_OVERLAP = 200
@@ -17,25 +19,41 @@ DEFAULT_CHUNK_OVERLAP = 200
 class GraphBuilderSupport:
     """Lazily constructs and executes KnowledgeGraphBuilder workflows."""
 
+    __slots__ = (
+        "driver",
+        "chunk_size",
+        "chunk_overlap",
+        "_builder",
+        "_loop",
+        "_loop_lock",
+    )
+
     def __init__(
         self,
-        driver: Driver,
+        driver: Optional[Driver] = None,
         chunk_size: Optional[int] = None,
         chunk_overlap: Optional[int] = None,
     ) -> None:
-        self.driver = driver
+        # The KnowledgeGraphBuilder and the neo4j_graphrag stack beneath it
+        # (SimpleKGPipeline, Neo4jWriter, resolvers) are sync-only, so this
+        # must be a sync driver — never the backend's AsyncDriver. Default
+        # to the shared sync singleton.
+        self.driver = driver or Config.get_neo4j_driver()
         self.chunk_size = chunk_size or getattr(Config, "KG_CHUNK_SIZE", DEFAULT_CHUNK_SIZE)
         self.chunk_overlap = chunk_overlap or getattr(Config, "KG_CHUNK_OVERLAP", DEFAULT_CHUNK_OVERLAP)
         self._builder: KnowledgeGraphBuilder | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_lock = threading.Lock()
 
     def get_builder(self) -> KnowledgeGraphBuilder:
         """Return (and lazily instantiate) the configured KnowledgeGraphBuilder."""
         if self._builder is None:
+            # Deferred: kg_builder pulls in the full neo4j_graphrag pipeline
+            # stack, which should not tax workers that never ingest.
+            from kg_builder import KnowledgeGraphBuilder
+
             llm = Config.get_llm()
-            embedder = OpenAIEmbeddings(
-                model=Config.EMBEDDING_MODEL,
-                base_url=Config.EMBEDDING_BASE_URL,
-            )
+            embedder = Config.get_embedder()
             self._builder = KnowledgeGraphBuilder(
                 driver=self.driver,
                 llm=llm,
@@ -46,22 +64,29 @@ class GraphBuilderSupport:
             )
         return self._builder
 
-    def run(self, async_callable: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any) -> Any:
-        """Execute a builder coroutine using a safe event loop."""
-
-        def _build_coro() -> Awaitable[Any]:
-            async def _runner() -> Any:
-                return await async_callable(*args, **kwargs)
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Return the shared background loop, starting it on first use."""
+        if self._loop is None:
+            with self._loop_lock:
+                if self._loop is None:
+                    loop = asyncio.new_event_loop()
+                    thread = threading.Thread(
+                        target=loop.run_forever,
+                        name="graph-builder-loop",
+                        daemon=True,
+                    )
+                    thread.start()
+                    self._loop = loop
+        return self._loop
 
-            return _runner()
+    def run(self, async_callable: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any) -> Any:
+        """Execute a builder coroutine on the shared background loop.
 
-        try:
-            return asyncio.run(_build_coro())
-        except RuntimeError as exc:
-            if "asyncio.run()" not in str(exc):
-                raise
-            loop = asyncio.new_event_loop()
-            try:
-                return loop.run_until_complete(_build_coro())
-            finally:
-                loop.close()
+        A single long-lived loop keeps the builder's HTTP and Bolt
+        connection pools alive between calls; asyncio.run would tear them
+        down (and re-handshake) on every invocation.
+        """
+        future = asyncio.run_coroutine_threadsafe(
+            async_callable(*args, **kwargs), self._ensure_loop()
+        )
+        return future.result()
@@ -5,32 +5,41 @@ from __future__ import annotations
 from typing import List, Dict, Any, Optional
 
 from backend.app.repositories.neo4j_repository import Neo4jRepository
+from backend.app.schemas import IndexCreate, IndexUpdate
 from backend.app.services.graph_builder_support import GraphBuilderSupport
-from kg_builder import EXAMPLE_SCHEMAS
+from kg_builder import EXAMPLE_SCHEMAS, SCHEMA_PRESETS
 
 
 class IndexService:
     """Encapsulates index CRUD operations and schema workflows."""
 
+    __slots__ = ("repository", "_graph_builder_support")
+
     def __init__(self, repository: Neo4jRepository) -> None:
         self.repository = repository
-        self._graph_builder_support = GraphBuilderSupport(repository.driver)
+        # The builder stack is sync-only; GraphBuilderSupport brings its own
+        # sync driver rather than borrowing the repository's async one
+        self._graph_builder_support = GraphBuilderSupport()
 
-    def list_indexes(self) -> List[Dict[str, Any]]:
-        return self.repository.list_indexes()
+    async def list_indexes(self) -> List[Dict[str, Any]]:
+        return await self.repository.list_indexes()
 
-    def get_index(self, name: str) -> Dict[str, Any] | None:
-        return self.repository.get_index(name)
+    async def get_index(self, name: str) -> Dict[str, Any] | None:
+        return await self.repository.get_index(name)
 
-    def create_index(self, payload: Dict[str, Any]) -> Dict[str, Any]:
-        return self.repository.upsert_index(payload)
+    async def create_index(self, payload: IndexCreate) -> Dict[str, Any] | None:
+        return await self.repository.create_index(
+            name=payload.name,
+            description=payload.description,
+            dimension=payload.dimension,
+        )
 
-    def update_index(self, name: str, payload: Dict[str, Any]) -> Dict[str, Any] | None:
-        data = {"name": name, **payload}
-        return self.repository.upsert_index(data)
+    async def update_index(self, name: str, payload: IndexUpdate) -> Dict[str, Any] | None:
+        patch = {field: getattr(payload, field) for field in payload.model_fields_set}
+        return await self.repository.update_index(name, patch)
 
-    def delete_index(self, name: str) -> None:
-        self.repository.delete_index(name)
+    async def delete_index(self, name: str) -> bool:
+        return await self.repository.delete_index(name)
 
     # ------------------------------------------------------------------
     # Knowledge graph schema helpers (align with example_kg_builder)
@@ -42,14 +51,17 @@ class IndexService:
 
     def apply_schema_preset(self, preset_name: str) -> Dict[str, Any]:
         """Apply one of the EXAMPLE_SCHEMAS presets to the builder."""
-        schema = self._get_schema_preset(preset_name)
+        preset = SCHEMA_PRESETS.get(preset_name)
+        if preset is None:
+            raise ValueError(f"Unknown schema preset: {preset_name}")
+        node_types, relationship_types, patterns = preset
         builder = self._graph_builder_support.get_builder()
         builder.define_schema(
-            node_types=schema["node_types"],
-            relationship_types=schema["relationship_types"],
-            patterns=schema["patterns"],
+            node_types=node_types,
+            relationship_types=relationship_types,
+            patterns=patterns,
         )
-        return schema
+        return EXAMPLE_SCHEMAS[preset_name]
 
     def define_custom_schema(
         self,
@@ -78,8 +90,3 @@ class IndexService:
             filter_query=filter_query,
         )
 
-    @staticmethod
-    def _get_schema_preset(preset_name: str) -> Dict[str, Any]:
-        if preset_name not in EXAMPLE_SCHEMAS:
-            raise ValueError(f"Unknown schema preset: {preset_name}")
-        return EXAMPLE_SCHEMAS[preset_name]
@@ -3,27 +3,52 @@
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Dict, Any, List, Optional
 
+import orjson
+
 from backend.app.core.clients import EmbeddingClient, ChatClient
 from backend.app.repositories.neo4j_repository import Neo4jRepository
 from config import Config
-from graphrag import GraphRAGPipeline
-from neo4j_graphrag.embeddings import OpenAIEmbeddings
-from retrievers import GraphRetrieverManager
 
 DEFAULT_SYSTEM_PROMPT = (
     "You are a helpful assistant. Use only the provided context to answer. "
     "If the context is insufficient, say you don't know."
 )
 FALLBACK_RESPONSE = "I don't have enough information to answer this question."
+CONTEXT_HEADER = "Context from the knowledge base:\n"
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1024)
+def _build_filters(index_name: Optional[str]) -> Optional[MappingProxyType]:
+    """Return a shared read-only filter mapping for an index name.
+
+    Cached so repeated queries against the same index reuse one object
+    instead of allocating an identical dict per request.
+    """
+    if not index_name:
+        return None
+    return MappingProxyType({"index": index_name})
+
+
 class SearchService:
     """Combines GraphRAG retrieval with a legacy fallback."""
 
+    __slots__ = (
+        "repository",
+        "embedder",
+        "legacy_llm",
+        "vector_index_name",
+        "fulltext_index_name",
+        "graph_llm",
+        "graph_embedder",
+        "retriever_manager",
+    )
+
     def __init__(
         self,
         repository: Neo4jRepository,
@@ -36,20 +61,29 @@ class SearchService:
         self.vector_index_name = Config.VECTOR_INDEX_NAME
         self.fulltext_index_name = Config.FULLTEXT_INDEX_NAME
 
-        # GraphRAG components inspired by example_rag_query
-        self.graph_llm = Config.get_llm()
-        self.graph_embedder = OpenAIEmbeddings(
-            model=Config.EMBEDDING_MODEL,
-            base_url=Config.EMBEDDING_BASE_URL,
-        )
-        self.retriever_manager = GraphRetrieverManager(
-            driver=self.repository.driver,
-            embedder=self.graph_embedder,
-            vector_index_name=self.vector_index_name,
-            fulltext_index_name=self.fulltext_index_name,
-        )
+        # GraphRAG components are built lazily: importing graphrag /
+        # neo4j_graphrag dominates worker cold start, and the legacy path
+        # never needs them.
+        self.graph_llm = None
+        self.graph_embedder = None
+        self.retriever_manager = None
+
+    def _get_retriever_manager(self):
+        """Build the GraphRAG components (and import their stack) on first use."""
+        if self.retriever_manager is None:
+            from retrievers import GraphRetrieverManager
+
+            self.graph_llm = Config.get_llm()
+            self.graph_embedder = Config.get_embedder()
+            self.retriever_manager = GraphRetrieverManager(
+                driver=self.repository.driver,
+                embedder=self.graph_embedder,
+                vector_index_name=self.vector_index_name,
+                fulltext_index_name=self.fulltext_index_name,
+            )
+        return self.retriever_manager
 
-    def rag_search(
+    async def rag_search(
         self,
         index_name: str,
         query: str,
@@ -57,26 +91,28 @@ class SearchService:
         top_k: int = 5,
     ) -> Dict[str, Any]:
         try:
-            return self._graph_rag_search(index_name, query, keywords, top_k)
+            return await self._graph_rag_search(index_name, query, keywords, top_k)
         except Exception as exc:  # pragma: no cover - graceful degradation
             logger.warning("GraphRAG search failed, using legacy fallback: %s", exc)
-            return self._legacy_search(index_name, query, keywords, top_k)
+            return await self._legacy_search(index_name, query, keywords, top_k)
 
-    def _graph_rag_search(
+    async def _graph_rag_search(
         self,
         index_name: str,
         query: str,
         keywords: Optional[List[str]],
         top_k: int,
     ) -> Dict[str, Any]:
+        from graphrag import GraphRAGPipeline
+
         retriever = self._select_retriever(keywords)
         pipeline = GraphRAGPipeline(retriever=retriever, llm=self.graph_llm)
         retriever_config: Dict[str, Any] = {"top_k": top_k}
-        filters = self._build_filters(index_name)
+        filters = _build_filters(index_name)
         if filters:
             retriever_config["filters"] = filters
 
-        result = pipeline.query(
+        result = await pipeline.query_async(
             question=query,
             retriever_config=retriever_config,
             return_context=True,
@@ -87,50 +123,50 @@ class SearchService:
         answer = result.answer or FALLBACK_RESPONSE
 
         if not chunks:
-            return self._legacy_search(index_name, query, keywords, top_k)
+            return await self._legacy_search(index_name, query, keywords, top_k)
         return {"answer": answer, "chunks": chunks}
 
     def _select_retriever(self, keywords: Optional[List[str]]):
+        manager = self._get_retriever_manager()
         if keywords:
             try:
-                return self.retriever_manager.get_hybrid_retriever(
+                return manager.get_hybrid_retriever(
                     return_properties=["text", "index", "metadata", "source"],
                 )
             except Exception as exc:  # pragma: no cover - hybrid not always available
                 logger.debug("Hybrid retriever unavailable: %s", exc)
-        return self.retriever_manager.get_vector_retriever(
+        return manager.get_vector_retriever(
             return_properties=["text", "index", "metadata", "document_id"],
         )
 
-    @staticmethod
-    def _build_filters(index_name: Optional[str]) -> Optional[Dict[str, Any]]:
-        if not index_name:
-            return None
-        return {"index": index_name}
-
     @staticmethod
     def _format_retrieved_chunks(items: List[Any]) -> List[Dict[str, Any]]:
         formatted: List[Dict[str, Any]] = []
+        append = formatted.append
         for idx, item in enumerate(items, start=1):
             metadata = item.metadata or {}
-            content = item.content or metadata.get("text") or metadata.get("chunk_text") or ""
-            formatted.append(
+            get = metadata.get
+            content = item.content or get("text") or get("chunk_text") or ""
+            score = getattr(item, "score", None)
+            if score is None:
+                score = get("score", 0.0)
+            append(
                 {
                     "doc_id": str(
-                        metadata.get("doc_id")
-                        or metadata.get("document_id")
-                        or metadata.get("chunk_id")
+                        get("doc_id")
+                        or get("document_id")
+                        or get("chunk_id")
                         or f"chunk_{idx}"
                     ),
                     "content": content,
                     "metadata": metadata,
-                    "score": float(getattr(item, "score", metadata.get("score", 0.0))),
+                    "score": float(score),
                 }
             )
         return formatted
 
     # Legacy vector search -------------------------------------------------
-    def _legacy_search(
+    async def _legacy_search(
         self,
         index_name: str,
         query: str,
@@ -138,13 +174,13 @@ class SearchService:
         top_k: int,
     ) -> Dict[str, Any]:
         try:
-            embedding = self.embedder.embed(query)
+            embedding = await self.embedder.embed(query)
         except Exception as exc:
             logger.warning("Legacy embedder failed, returning fallback: %s", exc)
-            return {"answer": FALLBACK_RESPONSE, "chunks": self._document_chunks_fallback(index_name, top_k)}
+            return {"answer": FALLBACK_RESPONSE, "chunks": await self._document_chunks_fallback(index_name, top_k)}
 
         try:
-            chunks = self.repository.vector_search(
+            chunks = await self.repository.vector_search(
                 index_name=index_name,
                 embedding=embedding,
                 top_k=top_k,
@@ -152,10 +188,10 @@ class SearchService:
             )
         except Exception as exc:
             logger.warning("Vector search failed, returning fallback: %s", exc)
-            return {"answer": FALLBACK_RESPONSE, "chunks": self._document_chunks_fallback(index_name, top_k)}
+            return {"answer": FALLBACK_RESPONSE, "chunks": await self._document_chunks_fallback(index_name, top_k)}
 
         if not chunks:
-            chunks = self._document_chunks_fallback(index_name, top_k)
+            chunks = await self._document_chunks_fallback(index_name, top_k)
 
         context = self._build_context(chunks)
         if not context:
@@ -163,15 +199,15 @@ class SearchService:
 
         user_prompt = self._build_prompt(context, query)
         try:
-            answer = self.legacy_llm.complete(DEFAULT_SYSTEM_PROMPT, user_prompt)
+            answer = await self.legacy_llm.complete(DEFAULT_SYSTEM_PROMPT, user_prompt)
         except Exception as exc:
             logger.warning("Legacy LLM failed, returning fallback: %s", exc)
             answer = FALLBACK_RESPONSE
         return {"answer": answer, "chunks": chunks}
 
-    def _document_chunks_fallback(self, index_name: str, top_k: int) -> List[Dict[str, Any]]:
+    async def _document_chunks_fallback(self, index_name: str, top_k: int) -> List[Dict[str, Any]]:
         """Return deterministic chunks built from stored documents or a synthetic placeholder."""
-        documents = self.repository.list_documents(index_name)[:top_k]
+        documents = await self.repository.list_documents(index_name, limit=top_k)
         if documents:
             return [
                 {
@@ -193,18 +229,25 @@ class SearchService:
 
     @staticmethod
     def _build_context(chunks: List[Dict[str, Any]]) -> str:
-        sections = []
-        for idx, chunk in enumerate(chunks, start=1):
-            metadata_str = "" if not chunk.get("metadata") else f"Metadata: {chunk['metadata']}\n"
-            sections.append(
-                f"Chunk {idx}:\n{metadata_str}{chunk.get('content', '')}\n"
+        # Compact JSON for metadata: orjson beats both dict.__repr__ and the
+        # stdlib encoder, and emits valid JSON instead of Python repr.
+        return "\n".join(
+            "Chunk {idx}:\n{metadata}{content}\n".format(
+                idx=idx,
+                metadata=(
+                    f"Metadata: {orjson.dumps(chunk['metadata']).decode()}\n"
+                    if chunk.get("metadata")
+                    else ""
+                ),
+                content=chunk.get("content", ""),
             )
-        return "\n".join(sections)
+            for idx, chunk in enumerate(chunks, start=1)
+        )
 
     @staticmethod
     def _build_prompt(context: str, question: str) -> str:
         return (
-            "Context from the knowledge base:\n"
+            f"{CONTEXT_HEADER}"
             f"{context}\n\n"
             f"Question: {question}\n"
             "Answer using only the context above."
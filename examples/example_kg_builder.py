@@ -6,12 +6,15 @@ import asyncio
 import sys
 from pathlib import Path
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Add parent directory to path (once; repeat imports must not grow sys.path)
+_PROJECT_ROOT = str(Path(__file__).resolve().parent.parent)
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
 
 from config import Config
 from kg_builder import KnowledgeGraphBuilder, EXAMPLE_SCHEMAS
-from neo4j_graphrag.embeddings import OpenAIEmbeddings
+
+_BAR = "=" * 80
 
 
 async def main():
@@ -19,9 +22,9 @@ async def main():
     Example workflow for building a knowledge graph.
     """
     
-    print("=" * 80)
+    print(_BAR)
     print("Neo4j GraphRAG - Knowledge Graph Builder Example")
-    print("=" * 80)
+    print(_BAR)
     
     # Initialize Neo4j driver
     print("\n1. Connecting to Neo4j...")
@@ -33,10 +36,7 @@ async def main():
     
     # Initialize Embedder
     print("3. Initializing Embedder...")
-    embedder = OpenAIEmbeddings(
-      model=Config.EMBEDDING_MODEL,
-      base_url=Config.EMBEDDING_BASE_URL,
-    )
+    embedder = Config.get_embedder()
     
     # Create Knowledge Graph Builder
     print("4. Creating Knowledge Graph Builder...")
@@ -50,9 +50,9 @@ async def main():
     )
     
     # Example 1: Build from text with automatic schema extraction
-    print("\n" + "=" * 80)
+    print("\n" + _BAR)
     print("EXAMPLE 1: Build KG from text with automatic schema extraction")
-    print("=" * 80)
+    print(_BAR)
     
     sample_text = """
     Dr. Jane Smith is a renowned researcher at Stanford University, specializing in 
@@ -73,28 +73,34 @@ async def main():
     schema = await kg_builder.extract_schema_from_text(sample_text)
     print(f"✓ Schema extracted and saved to 'extracted_schema.json'")
     
-    print("\nBuilding knowledge graph from text...")
-    result1 = await kg_builder.build_from_text(
-        text=sample_text,
-        document_metadata={
-            "source": "example_text",
-            "created_at": "2024-01-15",
-        },
-        perform_entity_resolution=True,
-    )
-    print(f"✓ Knowledge graph built successfully!")
+    # Builds are queued and run concurrently after the schemas are set up;
+    # resolution happens once at the end (Example 5) instead of per build
+    queued_builds = [
+        (
+            "Example 1 (auto schema)",
+            kg_builder,
+            sample_text,
+            {"source": "example_text", "created_at": "2024-01-15"},
+        )
+    ]
+    print("\nQueued build for concurrent execution")
     
     # Example 2: Build from text with predefined schema
-    print("\n" + "=" * 80)
+    print("\n" + _BAR)
     print("EXAMPLE 2: Build KG with predefined business schema")
-    print("=" * 80)
+    print(_BAR)
     
-    # Use predefined business schema
-    kg_builder.define_schema(
-        node_types=EXAMPLE_SCHEMAS["business"]["node_types"],
-        relationship_types=EXAMPLE_SCHEMAS["business"]["relationship_types"],
-        patterns=EXAMPLE_SCHEMAS["business"]["patterns"],
+    # Schema state lives on the builder, so each concurrent build gets its
+    # own builder instance (driver, LLM and embedder are shared singletons)
+    business_builder = KnowledgeGraphBuilder(
+        driver=driver,
+        llm=llm,
+        embedder=embedder,
+        neo4j_database=Config.NEO4J_DATABASE,
+        chunk_size=4000,
+        chunk_overlap=200,
     )
+    business_builder.define_schema(**EXAMPLE_SCHEMAS["business"])
     
     business_text = """
     TechCorp is a global technology company headquartered in San Francisco, California.
@@ -114,34 +120,38 @@ async def main():
     based in Boston. Together, they provide integrated solutions to Fortune 500 companies.
     """
     
-    print("\nBuilding knowledge graph with business schema...")
-    result2 = await kg_builder.build_from_text(
-        text=business_text,
-        document_metadata={
-            "source": "business_example",
-            "topic": "technology companies",
-        },
-        perform_entity_resolution=True,
+    queued_builds.append(
+        (
+            "Example 2 (business schema)",
+            business_builder,
+            business_text,
+            {"source": "business_example", "topic": "technology companies"},
+        )
     )
-    print(f"✓ Knowledge graph built successfully!")
+    print("\nQueued build for concurrent execution")
     
     # Example 3: Build from PDF (if you have a PDF file)
-    print("\n" + "=" * 80)
+    print("\n" + _BAR)
     print("EXAMPLE 3: Build KG from PDF file (optional)")
-    print("=" * 80)
+    print(_BAR)
     
     pdf_path = Path("sample_document.pdf")
     if pdf_path.exists():
         print(f"\nProcessing PDF: {pdf_path}")
         
-        # Use academic schema for research papers
-        kg_builder.define_schema(
-            node_types=EXAMPLE_SCHEMAS["academic"]["node_types"],
-            relationship_types=EXAMPLE_SCHEMAS["academic"]["relationship_types"],
-            patterns=EXAMPLE_SCHEMAS["academic"]["patterns"],
+        # Use academic schema for research papers (own builder: the auto
+        # schema on kg_builder must survive until its queued build runs)
+        academic_builder = KnowledgeGraphBuilder(
+            driver=driver,
+            llm=llm,
+            embedder=embedder,
+            neo4j_database=Config.NEO4J_DATABASE,
+            chunk_size=4000,
+            chunk_overlap=200,
         )
+        academic_builder.define_schema(**EXAMPLE_SCHEMAS["academic"])
         
-        result3 = await kg_builder.build_from_pdf(
+        result3 = await academic_builder.build_from_pdf(
             file_path=pdf_path,
             document_metadata={
                 "source": "sample_document.pdf",
@@ -151,41 +161,25 @@ async def main():
         )
         print(f"✓ Knowledge graph from PDF built successfully!")
     else:
-        print(f"\nℹ️  No PDF file found at {pdf_path}")
-        print("   Place a PDF file named 'sample_document.pdf' in the project directory to test PDF processing")
-    
-    # Example 4: Entity Resolution
-    print("\n" + "=" * 80)
-    print("EXAMPLE 4: Entity Resolution")
-    print("=" * 80)
-    
-    print("\nResolving duplicate entities...")
-    
-    # Try different resolution strategies
-    print("\n  - Exact match resolution...")
-    exact_result = await kg_builder.resolve_entities(resolver_type="exact")
-    print("  ✓ Exact match resolution completed")
-    
-    print("\n  - Semantic match resolution (using spaCy)...")
-    try:
-        semantic_result = await kg_builder.resolve_entities(resolver_type="semantic")
-        print("  ✓ Semantic match resolution completed")
-    except Exception as e:
-        print(f"  ⚠️  Semantic resolution requires spaCy: {e}")
-    
-    print("\n  - Fuzzy match resolution...")
-    try:
-        fuzzy_result = await kg_builder.resolve_entities(resolver_type="fuzzy")
-        print("  ✓ Fuzzy match resolution completed")
-    except Exception as e:
-        print(f"  ⚠️  Fuzzy resolution requires rapidfuzz: {e}")
+        print(
+            f"\nℹ️  No PDF file found at {pdf_path}"
+            "\n   Place a PDF file named 'sample_document.pdf' in the project directory to test PDF processing"
+        )
     
-    # Example 5: Custom Schema Definition
-    print("\n" + "=" * 80)
-    print("EXAMPLE 5: Custom Schema Definition")
-    print("=" * 80)
+    # Example 4: Custom Schema Definition
+    print("\n" + _BAR)
+    print("EXAMPLE 4: Custom Schema Definition")
+    print(_BAR)
     
-    custom_schema = kg_builder.define_schema(
+    custom_builder = KnowledgeGraphBuilder(
+        driver=driver,
+        llm=llm,
+        embedder=embedder,
+        neo4j_database=Config.NEO4J_DATABASE,
+        chunk_size=4000,
+        chunk_overlap=200,
+    )
+    custom_schema = custom_builder.define_schema(
         node_types=[
             "Person",
             {
@@ -211,10 +205,12 @@ async def main():
         ]
     )
     
-    print("\n✓ Custom schema defined:")
-    print(f"   - Node types: {len(custom_schema['node_types'])}")
-    print(f"   - Relationship types: {len(custom_schema['relationship_types'])}")
-    print(f"   - Patterns: {len(custom_schema['patterns'])}")
+    print(
+        f"\n✓ Custom schema defined:"
+        f"\n   - Node types: {len(custom_schema['node_types'])}"
+        f"\n   - Relationship types: {len(custom_schema['relationship_types'])}"
+        f"\n   - Patterns: {len(custom_schema['patterns'])}"
+    )
     
     tech_text = """
     Tim Berners-Lee invented the World Wide Web in 1989 while working at CERN.
@@ -228,30 +224,80 @@ async def main():
     research in the 1980s.
     """
     
-    print("\nBuilding knowledge graph with custom schema...")
-    result4 = await kg_builder.build_from_text(
-        text=tech_text,
-        document_metadata={"source": "technology_history"},
-        perform_entity_resolution=True,
+    queued_builds.append(
+        (
+            "Example 4 (custom schema)",
+            custom_builder,
+            tech_text,
+            {"source": "technology_history"},
+        )
     )
-    print("✓ Knowledge graph with custom schema built successfully!")
+    print("\nQueued build for concurrent execution")
+    
+    # Run the queued builds concurrently
+    print("\n" + _BAR)
+    print("Running queued knowledge graph builds concurrently")
+    print(_BAR)
+    
+    semaphore = asyncio.Semaphore(4)
+    
+    async def run_build(name, builder, text, metadata):
+        # LLM extraction dominates build time, so overlap the round-trips
+        async with semaphore:
+            result = await builder.build_from_text(
+                text=text,
+                document_metadata=metadata,
+                perform_entity_resolution=False,
+            )
+            print(f"✓ {name} build completed")
+            return result
+    
+    await asyncio.gather(*(run_build(*job) for job in queued_builds))
+    print("✓ All queued builds completed")
+    
+    # Example 5: Entity Resolution
+    print("\n" + _BAR)
+    print("EXAMPLE 5: Entity Resolution")
+    print(_BAR)
+    
+    print("\nResolving duplicate entities...")
+    
+    # Try different resolution strategies
+    print("\n  - Exact match resolution...")
+    exact_result = await kg_builder.resolve_entities(resolver_type="exact")
+    print("  ✓ Exact match resolution completed")
+    
+    print("\n  - Semantic match resolution (using spaCy)...")
+    try:
+        semantic_result = await kg_builder.resolve_entities(resolver_type="semantic")
+        print("  ✓ Semantic match resolution completed")
+    except Exception as e:
+        print(f"  ⚠️  Semantic resolution requires spaCy: {e}")
+    
+    print("\n  - Fuzzy match resolution...")
+    try:
+        fuzzy_result = await kg_builder.resolve_entities(resolver_type="fuzzy")
+        print("  ✓ Fuzzy match resolution completed")
+    except Exception as e:
+        print(f"  ⚠️  Fuzzy resolution requires rapidfuzz: {e}")
     
     # Cleanup
-    print("\n" + "=" * 80)
+    print("\n" + _BAR)
     print("Cleanup")
-    print("=" * 80)
-    kg_builder.close()
-    driver.close()  # Close the driver we created at the start
-    print("✓ Neo4j driver closed")
+    print(_BAR)
+    # The shared driver from Config.get_neo4j_driver() closes at exit
+    print("✓ Shared Neo4j driver closes automatically at exit")
     
-    print("\n" + "=" * 80)
+    print("\n" + _BAR)
     print("Examples completed successfully!")
-    print("=" * 80)
-    print("\nNext steps:")
-    print("1. Open Neo4j Browser at http://localhost:7474")
-    print("2. Run: MATCH (n) RETURN n LIMIT 50 to view your knowledge graph")
-    print("3. Run example_rag_query.py to query the knowledge graph")
-    print("=" * 80)
+    print(_BAR)
+    print(
+        "\nNext steps:"
+        "\n1. Open Neo4j Browser at http://localhost:7474"
+        "\n2. Run: MATCH (n) RETURN n LIMIT 50 to view your knowledge graph"
+        "\n3. Run example_rag_query.py to query the knowledge graph"
+    )
+    print(_BAR)
 
 
 if __name__ == "__main__":
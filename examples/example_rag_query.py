@@ -2,18 +2,47 @@
 Example: Querying the Knowledge Graph with GraphRAG
 """
 
-import asyncio
 import sys
 from pathlib import Path
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Add parent directory to path (once; repeat imports must not grow sys.path)
+_PROJECT_ROOT = str(Path(__file__).resolve().parent.parent)
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
 
 from config import Config
 from retrievers import GraphRetrieverManager, RETRIEVAL_QUERY_TEMPLATES, create_result_formatter
 from graphrag import GraphRAGPipeline, CustomPromptTemplates, MultiRetrieverRAG
 from utils import DatabaseUtils, IndexManager
-from neo4j_graphrag.embeddings import OpenAIEmbeddings
+
+_BAR = "=" * 80
+_THIN = "-" * 80
+
+
+# Text2Cypher inputs (Example 4) are constants; built once at import
+NEO4J_SCHEMA = """
+Node properties:
+Person {name: STRING}
+Organization {name: STRING}
+Technology {name: STRING, category: STRING}
+Location {name: STRING, country: STRING}
+
+Relationship properties:
+WORKS_FOR {since: DATE}
+FOUNDED {year: INTEGER}
+LOCATED_IN {}
+
+Relationships:
+(:Person)-[:WORKS_FOR]->(:Organization)
+(:Person)-[:FOUNDED]->(:Organization)
+(:Organization)-[:LOCATED_IN]->(:Location)
+(:Person)-[:INVENTED]->(:Technology)
+"""
+
+TEXT2CYPHER_EXAMPLES = [
+    "USER: 'Find all people' QUERY: MATCH (p:Person) RETURN p.name",
+    "USER: 'Which companies are in California?' QUERY: MATCH (o:Organization)-[:LOCATED_IN]->(l:Location {name: 'California'}) RETURN o.name",
+]
 
 
 def main():
@@ -21,9 +50,9 @@ def main():
     Example workflow for querying a knowledge graph with GraphRAG.
     """
     
-    print("=" * 80)
+    print(_BAR)
     print("Neo4j GraphRAG - Query Example")
-    print("=" * 80)
+    print(_BAR)
     
     # Initialize Neo4j driver
     print("\n1. Connecting to Neo4j...")
@@ -31,31 +60,32 @@ def main():
     
     # Check if database has data
     print("\n2. Checking database status...")
-    summary = DatabaseUtils.get_schema_summary(driver)
-    total_nodes = sum(summary["nodes_per_label"].values())
-    
-    if total_nodes == 0:
-        print("\n⚠️  WARNING: Your database is empty!")
-        print("\nYou need to build a knowledge graph first:")
-        print("  1. Run: uv run examples/example_kg_builder.py")
-        print("  2. Then come back and run this query example")
-        print("\nExiting...")
-        driver.close()
+    if not DatabaseUtils.has_any_nodes(driver):
+        # One buffered write instead of five line-flushed ones
+        print(
+            "\n⚠️  WARNING: Your database is empty!"
+            "\n\nYou need to build a knowledge graph first:"
+            "\n  1. Run: uv run examples/example_kg_builder.py"
+            "\n  2. Then come back and run this query example"
+            "\n\nExiting..."
+        )
         return
     
+    total_nodes = DatabaseUtils.get_node_count(driver)
     print(f"   ✓ Found {total_nodes:,} nodes in database")
     
     # Check if indexes exist
     index_manager = IndexManager(driver)
     indexes = index_manager.list_indexes()
-    index_names = [idx.get("name") for idx in indexes]
+    index_names = {idx.get("name") for idx in indexes}
     
     if Config.VECTOR_INDEX_NAME not in index_names:
-        print(f"\n⚠️  WARNING: Vector index '{Config.VECTOR_INDEX_NAME}' not found!")
-        print("\nThe knowledge graph builder should have created this index.")
-        print("Run: uv run examples/example_kg_builder.py")
-        print("\nExiting...")
-        driver.close()
+        print(
+            f"\n⚠️  WARNING: Vector index '{Config.VECTOR_INDEX_NAME}' not found!"
+            "\n\nThe knowledge graph builder should have created this index."
+            "\nRun: uv run examples/example_kg_builder.py"
+            "\n\nExiting..."
+        )
         return
     
     print(f"   ✓ Vector index '{Config.VECTOR_INDEX_NAME}' exists")
@@ -66,7 +96,7 @@ def main():
     
     # Initialize Embedder
     print("4. Initializing Embedder...")
-    embedder = OpenAIEmbeddings(model=Config.EMBEDDING_MODEL)
+    embedder = Config.get_embedder()
     
     # Create Retriever Manager
     print("5. Creating Retriever Manager...")
@@ -75,12 +105,13 @@ def main():
         embedder=embedder,
         vector_index_name=Config.VECTOR_INDEX_NAME,
         fulltext_index_name=Config.FULLTEXT_INDEX_NAME,
+        neo4j_database=Config.NEO4J_DATABASE,
     )
     
     # Example 1: Basic Vector Retrieval
-    print("\n" + "=" * 80)
+    print("\n" + _BAR)
     print("EXAMPLE 1: Basic Vector Retrieval")
-    print("=" * 80)
+    print(_BAR)
     
     vector_retriever = retriever_manager.get_vector_retriever(
         return_properties=["text", "index"]
@@ -93,7 +124,7 @@ def main():
     
     question1 = "What is artificial intelligence?"
     print(f"\nQuestion: {question1}")
-    print("-" * 80)
+    print(_THIN)
     
     response1 = rag_pipeline.query(
         question=question1,
@@ -107,9 +138,9 @@ def main():
         print(f"\nRetrieved {len(response1.retriever_result.items)} chunks")
     
     # Example 2: Vector Cypher Retrieval with Entity Context
-    print("\n" + "=" * 80)
+    print("\n" + _BAR)
     print("EXAMPLE 2: Vector Cypher Retrieval with Entity Context")
-    print("=" * 80)
+    print(_BAR)
     
     formatter = create_result_formatter(["text", "entities", "chunk_index"])
     
@@ -125,7 +156,7 @@ def main():
     
     question2 = "Who are the key people in AI research?"
     print(f"\nQuestion: {question2}")
-    print("-" * 80)
+    print(_THIN)
     
     response2 = rag_pipeline2.query(
         question=question2,
@@ -136,9 +167,9 @@ def main():
     print(f"\nAnswer:\n{response2.answer}")
     
     # Example 3: Hybrid Retrieval (Vector + Fulltext)
-    print("\n" + "=" * 80)
+    print("\n" + _BAR)
     print("EXAMPLE 3: Hybrid Retrieval (Vector + Fulltext)")
-    print("=" * 80)
+    print(_BAR)
     
     try:
         hybrid_retriever = retriever_manager.get_hybrid_retriever()
@@ -150,7 +181,7 @@ def main():
         
         question3 = "machine learning applications in healthcare"
         print(f"\nQuestion: {question3}")
-        print("-" * 80)
+        print(_THIN)
         
         response3 = rag_pipeline3.query(
             question=question3,
@@ -163,39 +194,14 @@ def main():
         print("   Create fulltext index first using utils.create_fulltext_index()")
     
     # Example 4: Text2Cypher - Natural Language to Cypher
-    print("\n" + "=" * 80)
+    print("\n" + _BAR)
     print("EXAMPLE 4: Text2Cypher - Natural Language to Cypher")
-    print("=" * 80)
-    
-    # Define Neo4j schema for Text2Cypher
-    neo4j_schema = """
-    Node properties:
-    Person {name: STRING}
-    Organization {name: STRING}
-    Technology {name: STRING, category: STRING}
-    Location {name: STRING, country: STRING}
-    
-    Relationship properties:
-    WORKS_FOR {since: DATE}
-    FOUNDED {year: INTEGER}
-    LOCATED_IN {}
-    
-    Relationships:
-    (:Person)-[:WORKS_FOR]->(:Organization)
-    (:Person)-[:FOUNDED]->(:Organization)
-    (:Organization)-[:LOCATED_IN]->(:Location)
-    (:Person)-[:INVENTED]->(:Technology)
-    """
-    
-    examples = [
-        "USER: 'Find all people' QUERY: MATCH (p:Person) RETURN p.name",
-        "USER: 'Which companies are in California?' QUERY: MATCH (o:Organization)-[:LOCATED_IN]->(l:Location {name: 'California'}) RETURN o.name",
-    ]
+    print(_BAR)
     
     text2cypher_retriever = retriever_manager.get_text2cypher_retriever(
         llm=llm,
-        neo4j_schema=neo4j_schema,
-        examples=examples,
+        neo4j_schema=NEO4J_SCHEMA,
+        examples=TEXT2CYPHER_EXAMPLES,
     )
     
     rag_pipeline4 = GraphRAGPipeline(
@@ -205,7 +211,7 @@ def main():
     
     question4 = "Who founded TechCorp?"
     print(f"\nQuestion: {question4}")
-    print("-" * 80)
+    print(_THIN)
     
     try:
         response4 = rag_pipeline4.query(
@@ -218,43 +224,36 @@ def main():
         print("   This is expected if the knowledge graph doesn't contain relevant data")
     
     # Example 5: Custom Prompt Templates
-    print("\n" + "=" * 80)
+    print("\n" + _BAR)
     print("EXAMPLE 5: Custom Prompt Templates")
-    print("=" * 80)
+    print(_BAR)
     
-    # Detailed template
-    detailed_template = CustomPromptTemplates.get_detailed_template()
-    rag_detailed = GraphRAGPipeline(
+    # Templates are built lazily (and cached) by CustomPromptTemplates, and
+    # one pipeline is reused with the template swapped between runs
+    rag_templated = GraphRAGPipeline(
         retriever=vector_retriever,
         llm=llm,
-        prompt_template=detailed_template,
+        prompt_template=CustomPromptTemplates.get_detailed_template(),
     )
-    
+
     question5 = "What are the main applications of machine learning?"
     print(f"\nQuestion: {question5}")
     print("Using: Detailed Template")
-    print("-" * 80)
-    
-    response5 = rag_detailed.query(question=question5)
+    print(_THIN)
+
+    response5 = rag_templated.query(question=question5)
     print(f"\nAnswer:\n{response5.answer}")
-    
-    # Conversational template
-    conversational_template = CustomPromptTemplates.get_conversational_template()
-    rag_conversational = GraphRAGPipeline(
-        retriever=vector_retriever,
-        llm=llm,
-        prompt_template=conversational_template,
-    )
-    
+
     print(f"\nSame question with Conversational Template:")
-    print("-" * 80)
-    response5b = rag_conversational.query(question=question5)
+    print(_THIN)
+    rag_templated.set_prompt_template(CustomPromptTemplates.get_conversational_template())
+    response5b = rag_templated.query(question=question5)
     print(f"\nAnswer:\n{response5b.answer}")
     
     # Example 6: Filtered Search
-    print("\n" + "=" * 80)
+    print("\n" + _BAR)
     print("EXAMPLE 6: Filtered Search")
-    print("=" * 80)
+    print(_BAR)
     
     # Search with filters
     filters = {
@@ -264,7 +263,7 @@ def main():
     question6 = "Tell me about technology companies"
     print(f"\nQuestion: {question6}")
     print(f"Filters: {filters}")
-    print("-" * 80)
+    print(_THIN)
     
     response6 = rag_pipeline.query(
         question=question6,
@@ -273,9 +272,9 @@ def main():
     print(f"\nAnswer:\n{response6.answer}")
     
     # Example 7: Batch Queries
-    print("\n" + "=" * 80)
+    print("\n" + _BAR)
     print("EXAMPLE 7: Batch Queries")
-    print("=" * 80)
+    print(_BAR)
     
     questions = [
         "What is deep learning?",
@@ -283,21 +282,26 @@ def main():
         "What are neural networks used for?",
     ]
     
-    print("\nProcessing multiple questions...")
-    responses = rag_pipeline.batch_query(questions, retriever_config={"top_k": 3})
+    print("\nProcessing multiple questions concurrently...")
+
+    # batch_query overlaps the independent embed/retrieve/LLM round-trips
+    responses = rag_pipeline.batch_query(
+        questions,
+        retriever_config={"top_k": 3},
+    )
     
     for i, (q, r) in enumerate(zip(questions, responses), 1):
         print(f"\nQ{i}: {q}")
         print(f"A{i}: {r.answer[:200]}...")  # First 200 chars
     
     # Example 8: Query with Fallback
-    print("\n" + "=" * 80)
+    print("\n" + _BAR)
     print("EXAMPLE 8: Query with Fallback Message")
-    print("=" * 80)
+    print(_BAR)
     
     question8 = "What is quantum computing?"  # Might not be in the KG
     print(f"\nQuestion: {question8}")
-    print("-" * 80)
+    print(_THIN)
     
     response8 = rag_pipeline.query(
         question=question8,
@@ -307,22 +311,24 @@ def main():
     print(f"\nAnswer:\n{response8.answer}")
     
     # Cleanup
-    print("\n" + "=" * 80)
+    print("\n" + _BAR)
     print("Cleanup")
-    print("=" * 80)
-    driver.close()
-    print("✓ Neo4j driver closed")
+    print(_BAR)
+    # The shared driver from Config.get_neo4j_driver() closes at exit
+    print("✓ Shared Neo4j driver closes automatically at exit")
     
-    print("\n" + "=" * 80)
+    print("\n" + _BAR)
     print("Query examples completed successfully!")
-    print("=" * 80)
-    print("\nKey Takeaways:")
-    print("1. Different retrievers work better for different use cases")
-    print("2. Vector retrieval: semantic similarity")
-    print("3. Hybrid retrieval: combines semantic + keyword matching")
-    print("4. Text2Cypher: precise queries using graph structure")
-    print("5. Custom prompts: tailor responses to your needs")
-    print("=" * 80)
+    print(_BAR)
+    print(
+        "\nKey Takeaways:"
+        "\n1. Different retrievers work better for different use cases"
+        "\n2. Vector retrieval: semantic similarity"
+        "\n3. Hybrid retrieval: combines semantic + keyword matching"
+        "\n4. Text2Cypher: precise queries using graph structure"
+        "\n5. Custom prompts: tailor responses to your needs"
+    )
+    print(_BAR)
 
 
 if __name__ == "__main__":
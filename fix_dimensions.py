@@ -3,7 +3,11 @@ Fix embedding dimension mismatch by recreating the vector index.
 Run this if you get a dimension mismatch error.
 """
 
+import hashlib
+import json
+import os
 import sys
+import tempfile
 from pathlib import Path
 
 # Add parent directory to path
@@ -14,6 +18,45 @@ from utils import IndexManager
 from neo4j_graphrag.embeddings import OpenAIEmbeddings
 
 
+def _probe_cache_path() -> Path:
+    """Location of the cached dimension probes ($XDG_CACHE_HOME aware)."""
+    cache_root = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(cache_root) / "poc_graph_pipeline_builder" / "dims.json"
+
+
+def _probe_cache_key() -> str:
+    """Stable key for the (model, base_url) pair being probed."""
+    raw = f"{Config.EMBEDDING_MODEL}|{Config.EMBEDDING_BASE_URL}"
+    return hashlib.sha1(raw.encode()).hexdigest()
+
+
+def _load_cached_dimensions(key: str):
+    try:
+        with open(_probe_cache_path()) as f:
+            return json.load(f).get(key)
+    except (OSError, ValueError):
+        return None
+
+
+def _store_cached_dimensions(key: str, dimensions: int) -> None:
+    path = _probe_cache_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            with open(path) as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            cache = {}
+        cache[key] = dimensions
+        # Atomic replace so a concurrent run never sees a torn write
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(cache, f)
+        os.replace(tmp, path)
+    except OSError:
+        pass  # Cache is best-effort; the live probe still worked
+
+
 def main():
     print("=" * 80)
     print("Fix Embedding Dimension Mismatch")
@@ -23,24 +66,35 @@ def main():
     driver = Config.get_neo4j_driver()
     index_manager = IndexManager(driver)
     
-    # Get actual embedding dimensions from the model
+    # Get actual embedding dimensions from the model; the live probe is a
+    # network round-trip, so its result is cached per (model, base_url)
+    # and reused on later runs unless --force is given
     print("\n1. Testing embedding model...")
     print(f"   Model: {Config.EMBEDDING_MODEL}")
     print(f"   Base URL: {Config.EMBEDDING_BASE_URL or 'default'}")
     
-    try:
-        embedder = OpenAIEmbeddings(
-            model=Config.EMBEDDING_MODEL,
-            base_url=Config.EMBEDDING_BASE_URL,
-        )
-        test_embedding = embedder.embed_query("test")
-        actual_dimensions = len(test_embedding)
-        print(f"   ✓ Actual dimensions: {actual_dimensions}")
-    except Exception as e:
-        print(f"   ✗ Error: {e}")
-        print("\nMake sure your embedding service is running!")
-        driver.close()
-        return
+    cache_key = _probe_cache_key()
+    actual_dimensions = None
+    if "--force" not in sys.argv:
+        actual_dimensions = _load_cached_dimensions(cache_key)
+        if actual_dimensions is not None:
+            print(f"   ✓ Cached dimensions: {actual_dimensions} (use --force to re-probe)")
+    
+    if actual_dimensions is None:
+        try:
+            embedder = OpenAIEmbeddings(
+                model=Config.EMBEDDING_MODEL,
+                base_url=Config.EMBEDDING_BASE_URL,
+            )
+            test_embedding = embedder.embed_query("test")
+            actual_dimensions = len(test_embedding)
+            print(f"   ✓ Actual dimensions: {actual_dimensions}")
+        except Exception as e:
+            print(f"   ✗ Error: {e}")
+            print("\nMake sure your embedding service is running!")
+            driver.close()
+            return
+        _store_cached_dimensions(cache_key, actual_dimensions)
     
     # Check configured dimensions
     print(f"\n2. Configured dimensions in .env: {Config.VECTOR_DIMENSIONS}")
@@ -3,6 +3,16 @@ GraphRAG module for Neo4j.
 Implements the complete RAG pipeline with LLM response generation.
 """
 
+import asyncio
+import hashlib
+import inspect
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Optional, Dict, List, Any
 from neo4j import Driver
 
@@ -12,9 +22,118 @@ from neo4j_graphrag.retrievers.base import Retriever
 from neo4j_graphrag.llm import LLMInterface
 
 
+# Frozen defaults shared by every call that passes no retriever_config:
+# the common path allocates neither a dict nor its sorted cache-key form
+_DEFAULT_RETRIEVER_CONFIG = MappingProxyType({"top_k": 5})
+_DEFAULT_CONFIG_REPR = repr(sorted(_DEFAULT_RETRIEVER_CONFIG.items()))
+_EMPTY_CONFIG = MappingProxyType({})
+
+
+# The sync neo4j-graphrag retrievers reach the event loop through worker
+# threads (asyncio.to_thread / search_async). Left alone, each loop grows
+# its own default executor of up to min(32, cpus + 4) threads; one shared
+# bounded pool keeps the thread count aligned with the Neo4j driver pool
+# so async fan-outs queue at the executor instead of piling onto the
+# database connection acquisition timeout.
+_ASYNC_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_ASYNC_EXECUTOR_LOCK = threading.Lock()
+_BOUND_LOOPS: "weakref.WeakSet" = weakref.WeakSet()
+
+
+def _bind_default_executor(loop: asyncio.AbstractEventLoop, max_workers: int) -> None:
+    """Install the shared bounded executor as the loop's default, once."""
+    global _ASYNC_EXECUTOR
+    if loop in _BOUND_LOOPS:
+        return
+    with _ASYNC_EXECUTOR_LOCK:
+        if _ASYNC_EXECUTOR is None:
+            _ASYNC_EXECUTOR = ThreadPoolExecutor(
+                max_workers=max_workers,
+                thread_name_prefix="graphrag-io",
+            )
+        if loop not in _BOUND_LOOPS:
+            loop.set_default_executor(_ASYNC_EXECUTOR)
+            _BOUND_LOOPS.add(loop)
+
+
+class _QueryCache:
+    """
+    Bounded TTL cache for query results with an optional semantic tier.
+
+    Exact hits are keyed on (question, retriever config); semantic hits
+    compare the question embedding against stored query embeddings by
+    cosine similarity, so near-duplicate phrasings of a cached question
+    skip retrieval and generation entirely. Semantic matching requires
+    numpy and silently degrades to exact-only matching without it.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float = 300.0,
+        similarity_threshold: float = 0.97,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.similarity_threshold = similarity_threshold
+        # key -> (config_key, embedding, result, expires_at)
+        self._entries: "OrderedDict[Any, tuple]" = OrderedDict()
+
+    def get_exact(self, key) -> Optional[RagResultModel]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() > entry[3]:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry[2]
+
+    def get_semantic(self, query_embedding, config_key) -> Optional[RagResultModel]:
+        if query_embedding is None:
+            return None
+        try:
+            import numpy as np
+        except ImportError:
+            return None
+        now = time.monotonic()
+        keys = []
+        vectors = []
+        # Only entries queried under the same retriever config are comparable
+        for key, (entry_config_key, embedding, _result, expires_at) in self._entries.items():
+            if embedding is not None and entry_config_key == config_key and expires_at >= now:
+                keys.append(key)
+                vectors.append(embedding)
+        if not vectors:
+            return None
+        matrix = np.asarray(vectors, dtype=np.float32)
+        query_vec = np.asarray(query_embedding, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(query_vec)
+        similarities = matrix @ query_vec / (norms + 1e-12)
+        best = int(similarities.argmax())
+        if similarities[best] < self.similarity_threshold:
+            return None
+        best_key = keys[best]
+        self._entries.move_to_end(best_key)
+        return self._entries[best_key][2]
+
+    def put(self, key, config_key, embedding, result: RagResultModel) -> None:
+        self._entries[key] = (config_key, embedding, result, time.monotonic() + self.ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
 class GraphRAGPipeline:
     """
     Complete GraphRAG pipeline for question answering.
+
+    A single instance can serve concurrent query() calls (e.g. from a
+    thread pool): the underlying GraphRAG is built once under a lock and
+    the retriever/LLM clients are shared rather than re-wired per call.
     """
     
     def __init__(
@@ -22,29 +141,165 @@ class GraphRAGPipeline:
         retriever: Retriever,
         llm: LLMInterface,
         prompt_template: Optional[RagTemplate] = None,
+        cache_size: int = 0,
+        cache_ttl: float = 300.0,
+        cache_similarity_threshold: float = 0.97,
+        async_workers: int = 8,
     ):
         """
         Initialize the GraphRAG pipeline.
-        
+
         Args:
             retriever: Retriever instance for fetching context
             llm: LLM interface for generating answers
             prompt_template: Optional custom prompt template
+            cache_size: Max cached query results (0 disables caching, the default)
+            cache_ttl: Seconds a cached result stays valid
+            cache_similarity_threshold: Cosine similarity above which a cached
+                question is treated as a match for a new one
+            async_workers: Size of the shared thread pool async queries use
+                for sync retriever calls; match it to the Neo4j driver pool
         """
         self.retriever = retriever
         self.llm = llm
-        
+        self._async_workers = async_workers
+        # Caching is opt-in: answers go stale when the graph changes, so
+        # callers decide whether repeats are worth serving from memory
+        self._query_cache = (
+            _QueryCache(cache_size, cache_ttl, cache_similarity_threshold)
+            if cache_size > 0
+            else None
+        )
+        # The retriever's embedder (when it has one) doubles as the encoder
+        # for semantic cache lookups
+        self._cache_embedder = getattr(retriever, "embedder", None)
+
+        # Inspect once whether retriever.search takes top_k/filters style
+        # kwargs; Text2Cypher-like retrievers don't, and detecting that by
+        # catching TypeError cost an exception throw on every call
+        try:
+            parameters = inspect.signature(retriever.search).parameters.values()
+            self._accepts_retriever_config = any(
+                p.kind == p.VAR_KEYWORD or p.name in ("top_k", "filters")
+                for p in parameters
+            )
+        except (TypeError, ValueError):
+            # Builtins/C-accelerated callables may refuse introspection
+            self._accepts_retriever_config = True
+
         # Use default template if none provided
         if prompt_template is None:
             prompt_template = RagTemplate()
-        
-        # Initialize GraphRAG pipeline
-        self.rag = GraphRAG(
-            retriever=retriever,
-            llm=llm,
-            prompt_template=prompt_template,
+        self._prompt_template = prompt_template
+
+        # GraphRAG wiring is deferred to first query so instances that are
+        # created but never queried (aborted request handlers, optional
+        # examples) pay nothing; the lock makes first-build safe under
+        # concurrent query() calls from multiple threads
+        self._rag: Optional[GraphRAG] = None
+        self._rag_lock = threading.Lock()
+
+    @property
+    def rag(self) -> GraphRAG:
+        """The underlying GraphRAG instance, built once on first use."""
+        if self._rag is None:
+            with self._rag_lock:
+                if self._rag is None:
+                    self._rag = GraphRAG(
+                        retriever=self.retriever,
+                        llm=self.llm,
+                        prompt_template=self._prompt_template,
+                    )
+        return self._rag
+
+    def set_prompt_template(self, prompt_template: Optional[RagTemplate] = None) -> None:
+        """
+        Swap the prompt template on the existing pipeline.
+
+        Args:
+            prompt_template: New template, or None to restore the default
+
+        Cheaper than wiring up a second pipeline when only the prompt differs.
+        """
+        if prompt_template is None:
+            prompt_template = RagTemplate()
+        self._prompt_template = prompt_template
+        if self._rag is not None:
+            self._rag.prompt_template = prompt_template
+
+    def _cache_keys(
+        self,
+        question: str,
+        retriever_config: Dict[str, Any],
+        return_context: bool,
+    ) -> tuple:
+        """Build the (cache_key, config_key) pair for a query."""
+        if retriever_config is _DEFAULT_RETRIEVER_CONFIG:
+            config_repr = _DEFAULT_CONFIG_REPR
+        else:
+            config_repr = repr(sorted(retriever_config.items()))
+        config_key = (config_repr, return_context)
+        # Deterministic digest keyed on question, config and model, so a
+        # model swap can never serve another model's cached answer
+        model_name = getattr(self.llm, "model_name", "")
+        cache_key = hashlib.sha256(
+            f"{question}|{config_key}|{model_name}".encode()
+        ).hexdigest()
+        return cache_key, config_key
+
+    def _probe_embedding(self, question: str):
+        """Embed the question for the semantic cache tier, or None."""
+        if self._cache_embedder is None:
+            return None
+        try:
+            return self._cache_embedder.embed_query(question)
+        except Exception:
+            # The real query path embeds again anyway; never fail a
+            # query because the cache probe could not
+            return None
+
+    def _cache_lookup(
+        self,
+        question: str,
+        retriever_config: Dict[str, Any],
+        return_context: bool,
+    ) -> tuple:
+        """
+        Check the query cache; returns (cache_key, config_key, embedding, hit).
+
+        The embedding computed for the semantic lookup is returned so a miss
+        can be inserted later without re-embedding the question.
+        """
+        cache_key, config_key = self._cache_keys(
+            question, retriever_config, return_context
         )
-    
+        cached = self._query_cache.get_exact(cache_key)
+        if cached is not None:
+            return cache_key, config_key, None, cached
+        embedding = self._probe_embedding(question)
+        cached = self._query_cache.get_semantic(embedding, config_key)
+        return cache_key, config_key, embedding, cached
+
+    async def _cache_lookup_async(
+        self,
+        question: str,
+        retriever_config: Dict[str, Any],
+        return_context: bool,
+    ) -> tuple:
+        """
+        Async _cache_lookup: the probe embedding is a blocking HTTP call,
+        so it runs on the bound executor instead of the event loop.
+        """
+        cache_key, config_key = self._cache_keys(
+            question, retriever_config, return_context
+        )
+        cached = self._query_cache.get_exact(cache_key)
+        if cached is not None:
+            return cache_key, config_key, None, cached
+        embedding = await asyncio.to_thread(self._probe_embedding, question)
+        cached = self._query_cache.get_semantic(embedding, config_key)
+        return cache_key, config_key, embedding, cached
+
     def query(
         self,
         question: str,
@@ -74,32 +329,33 @@ class GraphRAGPipeline:
             if return_context:
                 print(response.retriever_result)
         """
-        # Only set default top_k if not provided
-        # Some retrievers (like Text2Cypher) don't accept these parameters
+        # Only set default top_k if not provided; retrievers that don't
+        # take these kwargs (like Text2Cypher) get an empty config instead
+        # of a raise-and-retry round trip
         if retriever_config is None:
-            retriever_config = {"top_k": 5}
-        
-        try:
-            result = self.rag.search(
-                query_text=question,
-                retriever_config=retriever_config,
-                return_context=return_context,
-                response_fallback=response_fallback,
+            retriever_config = _DEFAULT_RETRIEVER_CONFIG
+        if not self._accepts_retriever_config:
+            retriever_config = _EMPTY_CONFIG
+
+        cache_key = config_key = query_embedding = None
+        if self._query_cache is not None:
+            cache_key, config_key, query_embedding, cached = self._cache_lookup(
+                question, retriever_config, return_context
             )
-        except TypeError as e:
-            # If retriever doesn't accept retriever_config parameters, retry without them
-            if "unexpected keyword argument" in str(e):
-                result = self.rag.search(
-                    query_text=question,
-                    retriever_config={},
-                    return_context=return_context,
-                    response_fallback=response_fallback,
-                )
-            else:
-                raise
-        
+            if cached is not None:
+                return cached
+
+        result = self.rag.search(
+            query_text=question,
+            retriever_config=retriever_config,
+            return_context=return_context,
+            response_fallback=response_fallback,
+        )
+
+        if self._query_cache is not None:
+            self._query_cache.put(cache_key, config_key, query_embedding, result)
         return result
-    
+
     async def query_async(
         self,
         question: str,
@@ -119,75 +375,160 @@ class GraphRAGPipeline:
         Returns:
             RagResultModel with answer and optional context
         """
-        # Only set default top_k if not provided
-        # Some retrievers (like Text2Cypher) don't accept these parameters
+        _bind_default_executor(asyncio.get_running_loop(), self._async_workers)
+
+        # Only set default top_k if not provided; retrievers that don't
+        # take these kwargs (like Text2Cypher) get an empty config instead
+        # of a raise-and-retry round trip
         if retriever_config is None:
-            retriever_config = {"top_k": 5}
-        
-        try:
-            result = await self.rag.search_async(
-                query_text=question,
-                retriever_config=retriever_config,
-                return_context=return_context,
-                response_fallback=response_fallback,
+            retriever_config = _DEFAULT_RETRIEVER_CONFIG
+        if not self._accepts_retriever_config:
+            retriever_config = _EMPTY_CONFIG
+
+        cache_key = config_key = query_embedding = None
+        if self._query_cache is not None:
+            cache_key, config_key, query_embedding, cached = (
+                await self._cache_lookup_async(
+                    question, retriever_config, return_context
+                )
             )
-        except TypeError as e:
-            # If retriever doesn't accept retriever_config parameters, retry without them
-            if "unexpected keyword argument" in str(e):
-                result = await self.rag.search_async(
-                    query_text=question,
-                    retriever_config={},
+            if cached is not None:
+                return cached
+
+        result = await self.rag.search_async(
+            query_text=question,
+            retriever_config=retriever_config,
+            return_context=return_context,
+            response_fallback=response_fallback,
+        )
+
+        if self._query_cache is not None:
+            self._query_cache.put(cache_key, config_key, query_embedding, result)
+        return result
+
+    def query_stream(
+        self,
+        question: str,
+        retriever_config: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Stream the answer for a question, yielding text chunks as they arrive.
+
+        Retrieval runs first, then generation streams when the LLM exposes a
+        streaming API, so time-to-first-token drops to roughly the retrieval
+        latency instead of waiting for the full completion. LLMs without
+        streaming support yield the complete answer as a single chunk.
+        Streamed answers bypass the query cache.
+
+        Yields:
+            str chunks of the generated answer
+        """
+        if retriever_config is None:
+            retriever_config = _DEFAULT_RETRIEVER_CONFIG
+        if not self._accepts_retriever_config:
+            retriever_config = _EMPTY_CONFIG
+
+        stream_fn = getattr(self.llm, "invoke_stream", None) or getattr(
+            self.llm, "stream", None
+        )
+        if stream_fn is None:
+            yield self.query(question, retriever_config=dict(retriever_config)).answer
+            return
+
+        retriever_result = self.retriever.search(query_text=question, **retriever_config)
+        context = "\n\n".join(item.content for item in retriever_result.items)
+        prompt = self._prompt_template.format(
+            query_text=question, context=context, examples=""
+        )
+        for chunk in stream_fn(prompt):
+            yield getattr(chunk, "content", chunk)
+
+    @staticmethod
+    def collect_stream(chunks) -> RagResultModel:
+        """Concatenate streamed chunks into a RagResultModel."""
+        return RagResultModel(answer="".join(chunks), retriever_result=None)
+
+    async def batch_query_async(
+        self,
+        questions: List[str],
+        retriever_config: Optional[Dict[str, Any]] = None,
+        return_context: bool = False,
+        max_concurrency: int = 8,
+    ) -> List[RagResultModel]:
+        """
+        Process multiple questions concurrently.
+
+        Queries are independent and I/O-bound, so they run under
+        asyncio.gather with a semaphore bounding in-flight requests to
+        respect LLM/embedding rate limits.
+
+        Args:
+            questions: List of questions
+            retriever_config: Configuration for the retriever
+            return_context: Whether to return context for each question
+            max_concurrency: Max queries in flight at once
+
+        Returns:
+            List of RagResultModel objects, in input order
+        """
+        # Pre-embed the whole batch in one call when the retriever's
+        # embedder supports it (the manager's caching wrapper does): the
+        # per-question searches then hit warm embeddings instead of issuing
+        # N separate embedding round-trips
+        embedder = getattr(self.retriever, "embedder", None)
+        if len(questions) > 1 and hasattr(embedder, "embed_documents"):
+            try:
+                await asyncio.to_thread(embedder.embed_documents, list(questions))
+            except Exception:
+                pass  # fall back to per-question embedding in the search path
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def one(question: str) -> RagResultModel:
+            async with semaphore:
+                return await self.query_async(
+                    question=question,
+                    retriever_config=retriever_config,
                     return_context=return_context,
-                    response_fallback=response_fallback,
                 )
-            else:
-                raise
-        
-        return result
-    
+
+        return list(await asyncio.gather(*(one(q) for q in questions)))
+
     def batch_query(
         self,
         questions: List[str],
         retriever_config: Optional[Dict[str, Any]] = None,
         return_context: bool = False,
+        max_concurrency: int = 8,
     ) -> List[RagResultModel]:
         """
         Process multiple questions in batch.
-        
+
+        Sync wrapper around batch_query_async; wall-clock time scales with
+        ceil(N / max_concurrency) instead of N.
+
         Args:
             questions: List of questions
             retriever_config: Configuration for the retriever
             return_context: Whether to return context for each question
-        
+            max_concurrency: Max queries in flight at once
+
         Returns:
-            List of RagResultModel objects
+            List of RagResultModel objects, in input order
         """
-        results = []
-        for question in questions:
-            result = self.query(
-                question=question,
+        return asyncio.run(
+            self.batch_query_async(
+                questions,
                 retriever_config=retriever_config,
                 return_context=return_context,
+                max_concurrency=max_concurrency,
             )
-            results.append(result)
-        
-        return results
+        )
 
 
-class CustomPromptTemplates:
-    """
-    Collection of custom prompt templates for different use cases.
-    """
-    
-    @staticmethod
-    def get_detailed_template() -> RagTemplate:
-        """
-        Detailed prompt template with strict instructions.
-        
-        Returns:
-            RagTemplate instance
-        """
-        prompt = """
+# Prompt bodies are fixed strings; building them once at module load keeps
+# template construction off the per-request path.
+_DETAILED_PROMPT = """
 You are a helpful AI assistant answering questions based on the provided context from a knowledge graph.
 
 Context:
@@ -204,20 +545,8 @@ Instructions:
 
 Answer:
 """
-        return RagTemplate(
-            template=prompt,
-            expected_inputs=["context", "query_text"]
-        )
-    
-    @staticmethod
-    def get_conversational_template() -> RagTemplate:
-        """
-        Conversational prompt template.
-        
-        Returns:
-            RagTemplate instance
-        """
-        prompt = """
+
+_CONVERSATIONAL_PROMPT = """
 You are a friendly and knowledgeable AI assistant with access to a knowledge graph.
 
 Relevant information from the knowledge graph:
@@ -229,20 +558,8 @@ Please provide a helpful, conversational answer based on the information above.
 
 Answer:
 """
-        return RagTemplate(
-            template=prompt,
-            expected_inputs=["context", "query_text"]
-        )
-    
-    @staticmethod
-    def get_academic_template() -> RagTemplate:
-        """
-        Academic/research-focused prompt template.
-        
-        Returns:
-            RagTemplate instance
-        """
-        prompt = """
+
+_ACADEMIC_PROMPT = """
 You are an academic research assistant analyzing information from a knowledge graph.
 
 Research context:
@@ -258,20 +575,8 @@ Provide a scholarly response that:
 
 Response:
 """
-        return RagTemplate(
-            template=prompt,
-            expected_inputs=["context", "query_text"]
-        )
-    
-    @staticmethod
-    def get_structured_template() -> RagTemplate:
-        """
-        Structured output prompt template.
-        
-        Returns:
-            RagTemplate instance
-        """
-        prompt = """
+
+_STRUCTURED_PROMPT = """
 You are an AI assistant that provides structured answers based on knowledge graph data.
 
 Context from knowledge graph:
@@ -297,8 +602,66 @@ Provide your answer in the following structured format:
 
 Response:
 """
+
+
+class CustomPromptTemplates:
+    """
+    Collection of custom prompt templates for different use cases.
+    """
+    
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get_detailed_template() -> RagTemplate:
+        """
+        Detailed prompt template with strict instructions.
+        
+        Returns:
+            RagTemplate instance
+        """
+        return RagTemplate(
+            template=_DETAILED_PROMPT,
+            expected_inputs=["context", "query_text"]
+        )
+    
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get_conversational_template() -> RagTemplate:
+        """
+        Conversational prompt template.
+        
+        Returns:
+            RagTemplate instance
+        """
         return RagTemplate(
-            template=prompt,
+            template=_CONVERSATIONAL_PROMPT,
+            expected_inputs=["context", "query_text"]
+        )
+    
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get_academic_template() -> RagTemplate:
+        """
+        Academic/research-focused prompt template.
+        
+        Returns:
+            RagTemplate instance
+        """
+        return RagTemplate(
+            template=_ACADEMIC_PROMPT,
+            expected_inputs=["context", "query_text"]
+        )
+    
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get_structured_template() -> RagTemplate:
+        """
+        Structured output prompt template.
+        
+        Returns:
+            RagTemplate instance
+        """
+        return RagTemplate(
+            template=_STRUCTURED_PROMPT,
             expected_inputs=["context", "query_text"]
         )
     
@@ -332,14 +695,28 @@ Response:
             )
         """
         if expected_inputs is None:
-            expected_inputs = ["context", "question"]
-        
+            expected_inputs = ("context", "question")
+        # Memoized so repeated dynamic templates reuse one instance
+        return CustomPromptTemplates._build_custom_template(
+            template, tuple(expected_inputs)
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _build_custom_template(template: str, expected_inputs: tuple) -> RagTemplate:
         return RagTemplate(
             template=template,
-            expected_inputs=expected_inputs
+            expected_inputs=list(expected_inputs)
         )
 
 
+class _SafeDict(dict):
+    """format_map argument that renders missing template fields as ''."""
+
+    def __missing__(self, key):
+        return ""
+
+
 class MultiRetrieverRAG:
     """
     GraphRAG pipeline that combines multiple retrievers.
@@ -350,19 +727,52 @@ class MultiRetrieverRAG:
         retrievers: List[Retriever],
         llm: LLMInterface,
         prompt_template: Optional[RagTemplate] = None,
+        max_context_chars: Optional[int] = None,
     ):
         """
         Initialize multi-retriever RAG.
-        
+
         Args:
             retrievers: List of retriever instances
             llm: LLM interface
             prompt_template: Optional custom prompt template
+            max_context_chars: Stop assembling context past this many
+                characters; anything beyond the LLM context window would be
+                truncated anyway, so don't build (or pay tokens for) it
         """
         self.retrievers = retrievers
         self.llm = llm
         self.prompt_template = prompt_template
-    
+        self.max_context_chars = max_context_chars
+        # Bind the raw template string's format_map once so each query
+        # skips RagTemplate's parse/validation layer
+        self._format_prompt = (
+            prompt_template.template.format_map if prompt_template is not None else None
+        )
+        # Lazily created pool for the sync fan-out; retrieval is I/O-bound,
+        # so one worker per retriever turns Σtᵢ into max(tᵢ)
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def _search_all(
+        self,
+        question: str,
+        retriever_configs: List[Dict[str, Any]],
+    ) -> List[Any]:
+        """Run every retriever concurrently and collect their items."""
+        if len(self.retrievers) == 1:
+            result = self.retrievers[0].search(query_text=question, **retriever_configs[0])
+            return list(result.items)
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=len(self.retrievers))
+        futures = [
+            self._executor.submit(retriever.search, query_text=question, **config)
+            for retriever, config in zip(self.retrievers, retriever_configs)
+        ]
+        all_results = []
+        for future in futures:
+            all_results.extend(future.result().items)
+        return all_results
+
     def query(
         self,
         question: str,
@@ -371,53 +781,102 @@ class MultiRetrieverRAG:
     ) -> RagResultModel:
         """
         Query using multiple retrievers and merge results.
-        
+
+        Retrievers run concurrently (thread pool), so total retrieval
+        latency is bounded by the slowest retriever rather than the sum.
+
         Args:
             question: User question
             retriever_configs: List of configs for each retriever
             merge_strategy: How to merge results ("concatenate", "deduplicate", "rank")
-        
+
         Returns:
             RagResultModel with combined answer
         """
         if retriever_configs is None:
             retriever_configs = [{"top_k": 5}] * len(self.retrievers)
-        
-        # Retrieve from all retrievers
-        all_results = []
-        for retriever, config in zip(self.retrievers, retriever_configs):
-            result = retriever.search(query_text=question, **config)
-            all_results.extend(result.items)
-        
+
+        all_results = self._search_all(question, retriever_configs)
+        return self._merge_and_answer(question, all_results, merge_strategy)
+
+    async def query_async(
+        self,
+        question: str,
+        retriever_configs: Optional[List[Dict[str, Any]]] = None,
+        merge_strategy: str = "concatenate",
+    ) -> RagResultModel:
+        """
+        Async version of query.
+
+        The underlying retrievers are sync, so each search is dispatched to
+        a worker thread and awaited together via asyncio.gather.
+        """
+        if retriever_configs is None:
+            retriever_configs = [{"top_k": 5}] * len(self.retrievers)
+
+        results = await asyncio.gather(*(
+            asyncio.to_thread(retriever.search, query_text=question, **config)
+            for retriever, config in zip(self.retrievers, retriever_configs)
+        ))
+        all_results = [item for result in results for item in result.items]
+        return self._merge_and_answer(question, all_results, merge_strategy)
+
+    def _merge_and_answer(
+        self,
+        question: str,
+        all_results: List[Any],
+        merge_strategy: str,
+    ) -> RagResultModel:
+        """Merge retrieved items per strategy and generate the answer."""
         # Merge results based on strategy
         if merge_strategy == "concatenate":
             merged_items = all_results
         elif merge_strategy == "deduplicate":
-            # Deduplicate based on content
-            seen_content = set()
+            # Deduplicate on a content hash: the set holds small ints
+            # instead of multi-KB chunk strings
+            seen_hashes = set()
             merged_items = []
             for item in all_results:
-                if item.content not in seen_content:
-                    seen_content.add(item.content)
+                content_hash = hash(item.content)
+                if content_hash not in seen_hashes:
+                    seen_hashes.add(content_hash)
                     merged_items.append(item)
         elif merge_strategy == "rank":
-            # Sort by score if available
-            merged_items = sorted(
+            # Sort by score, then drop duplicate contents keeping the
+            # highest-scored copy — overlapping retrievers would otherwise
+            # inflate the prompt with repeated chunks
+            seen_hashes = set()
+            merged_items = []
+            ranked = sorted(
                 all_results,
                 key=lambda x: x.metadata.get("score", 0),
                 reverse=True
             )
+            for item in ranked:
+                content_hash = hash(item.content)
+                if content_hash not in seen_hashes:
+                    seen_hashes.add(content_hash)
+                    merged_items.append(item)
         else:
             merged_items = all_results
-        
+
         # Create context from merged items
-        context = "\n\n".join([item.content for item in merged_items])
+        if self.max_context_chars is None:
+            context = "\n\n".join(item.content for item in merged_items)
+        else:
+            parts = []
+            total = 0
+            for item in merged_items:
+                parts.append(item.content)
+                total += len(item.content) + 2
+                if total >= self.max_context_chars:
+                    break
+            context = "\n\n".join(parts)
         
         # Generate answer
-        if self.prompt_template:
-            prompt_input = self.prompt_template.format(
-                context=context,
-                question=question
+        if self._format_prompt is not None:
+            prompt_input = self._format_prompt(
+                _SafeDict(context=context, question=question)
             )
         else:
             prompt_input = f"Context:\n{context}\n\nQuestion: {question}\n\nAnswer:"
@@ -430,11 +889,29 @@ class MultiRetrieverRAG:
         )
 
 
+class _BoundedFeedbackStore(OrderedDict):
+    """
+    OrderedDict that evicts its oldest entry once maxlen is exceeded.
+
+    Keeps long-running servers from growing the feedback store without
+    bound; callers that need persistence should supply their own mapping.
+    """
+
+    def __init__(self, maxlen: int = 10_000):
+        super().__init__()
+        self.maxlen = maxlen
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        if len(self) > self.maxlen:
+            self.popitem(last=False)
+
+
 class RAGWithFeedback:
     """
     GraphRAG pipeline with user feedback mechanism.
     """
-    
+
     def __init__(
         self,
         rag_pipeline: GraphRAGPipeline,
@@ -442,13 +919,37 @@ class RAGWithFeedback:
     ):
         """
         Initialize RAG with feedback.
-        
+
         Args:
             rag_pipeline: Base GraphRAG pipeline
-            feedback_store: Optional dictionary to store feedback
+            feedback_store: Optional dictionary to store feedback; defaults
+                to a bounded store capped at 10,000 entries
         """
         self.rag_pipeline = rag_pipeline
-        self.feedback_store = feedback_store or {}
+        self.feedback_store = (
+            feedback_store if feedback_store is not None else _BoundedFeedbackStore()
+        )
+        # Monotonic id source: len()-based ids would repeat once the
+        # bounded store starts evicting
+        self._query_seq = len(self.feedback_store)
+        # Rolling aggregates maintained by add_feedback so the summary
+        # never has to rescan the store
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        """Recompute the rolling feedback aggregates from the store contents."""
+        self._feedback_count = 0
+        self._rating_sum = 0
+        self._rating_count = 0
+        for entry in self.feedback_store.values():
+            feedback = entry.get("feedback")
+            if feedback is None:
+                continue
+            self._feedback_count += 1
+            rating = feedback.get("rating")
+            if rating is not None:
+                self._rating_sum += rating
+                self._rating_count += 1
     
     def query_with_feedback(
         self,
@@ -472,7 +973,8 @@ class RAGWithFeedback:
         )
         
         # Generate query ID
-        query_id = f"query_{len(self.feedback_store)}"
+        query_id = f"query_{self._query_seq}"
+        self._query_seq += 1
         
         # Store query for feedback
         self.feedback_store[query_id] = {
@@ -496,8 +998,25 @@ class RAGWithFeedback:
             query_id: Query identifier
             feedback: Feedback dictionary (e.g., {"rating": 5, "comment": "Great!"})
         """
-        if query_id in self.feedback_store:
-            self.feedback_store[query_id]["feedback"] = feedback
+        entry = self.feedback_store.get(query_id)
+        if entry is None:
+            return
+        # Retract the old feedback's contribution before applying the new
+        # one, so re-submitted feedback doesn't double-count
+        old = entry["feedback"]
+        if old is not None:
+            self._feedback_count -= 1
+            old_rating = old.get("rating")
+            if old_rating is not None:
+                self._rating_sum -= old_rating
+                self._rating_count -= 1
+        entry["feedback"] = feedback
+        if feedback is not None:
+            self._feedback_count += 1
+            rating = feedback.get("rating")
+            if rating is not None:
+                self._rating_sum += rating
+                self._rating_count += 1
     
     def get_feedback_summary(self) -> Dict[str, Any]:
         """
@@ -506,20 +1025,12 @@ class RAGWithFeedback:
         Returns:
             Summary dictionary
         """
+        # O(1): add_feedback maintains the aggregates as feedback arrives,
+        # so polling the summary costs the same however large the store is
         total_queries = len(self.feedback_store)
-        queries_with_feedback = sum(
-            1 for q in self.feedback_store.values() 
-            if q["feedback"] is not None
-        )
-        
-        ratings = [
-            q["feedback"]["rating"] 
-            for q in self.feedback_store.values() 
-            if q["feedback"] and "rating" in q["feedback"]
-        ]
-        
-        avg_rating = sum(ratings) / len(ratings) if ratings else 0
-        
+        queries_with_feedback = self._feedback_count
+        avg_rating = self._rating_sum / self._rating_count if self._rating_count else 0
+
         return {
             "total_queries": total_queries,
             "queries_with_feedback": queries_with_feedback,
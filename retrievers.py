@@ -3,6 +3,13 @@ Retriever module for Neo4j GraphRAG.
 Implements various retrieval strategies for querying the knowledge graph.
 """
 
+import hashlib
+import heapq
+import itertools
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Optional, Dict, List, Any
 from neo4j import Driver
 
@@ -22,31 +29,162 @@ from neo4j_graphrag.types import RetrieverResultItem
 import neo4j
 
 
+class _CachingEmbedder(Embedder):
+    """
+    Embedder wrapper that memoizes embed_query results per query string.
+
+    Queries often repeat verbatim (the same question run against several
+    retriever types, or re-asked with a different prompt template), and each
+    repeat would otherwise trigger a fresh embedding API call. An LRU keyed
+    on the exact query text turns those repeats into dictionary lookups.
+    """
+
+    def __init__(self, embedder: Embedder, maxsize: int = 1024):
+        self._embedder = embedder
+        self._maxsize = maxsize
+        self._cache: "OrderedDict[str, List[float]]" = OrderedDict()
+
+    def embed_query(self, text: str, **kwargs: Any) -> List[float]:
+        if kwargs:
+            # Non-default embedding options may change the vector; skip the cache
+            return self._embedder.embed_query(text, **kwargs)
+        cached = self._cache.get(text)
+        if cached is not None:
+            self._cache.move_to_end(text)
+            return cached
+        vector = self._embedder.embed_query(text)
+        self._cache[text] = vector
+        if len(self._cache) > self._maxsize:
+            self._cache.popitem(last=False)
+        return vector
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """
+        Batch-embed texts, seeding the query cache with each result.
+
+        Uses the wrapped embedder's batch API when it has one so N texts
+        cost one round-trip; later embed_query calls for the same texts
+        become cache hits.
+        """
+        inner = getattr(self._embedder, "embed_documents", None)
+        if inner is None:
+            return [self.embed_query(text) for text in texts]
+        vectors = inner(texts)
+        for text, vector in zip(texts, vectors):
+            self._cache[text] = vector
+            self._cache.move_to_end(text)
+        while len(self._cache) > self._maxsize:
+            self._cache.popitem(last=False)
+        return vectors
+
+
+class _MemoizingLLM(LLMInterface):
+    """
+    LLM wrapper that memoizes invoke results per prompt.
+
+    Text2Cypher bakes the schema and examples into the prompt, so an
+    identical prompt asks for the same Cypher every time. Caching the
+    response collapses the ~1 s generation round-trip into a dictionary
+    lookup for repeated questions, while the generated Cypher still runs
+    against the live graph. Prompts are fingerprinted with blake2b so keys
+    stay small, and entries expire after ttl seconds when one is set.
+    """
+
+    def __init__(self, llm: LLMInterface, maxsize: int = 256, ttl: Optional[float] = None):
+        self._llm = llm
+        self._maxsize = maxsize
+        self._ttl = ttl
+        # key -> (expires_at, response)
+        self._cache: "OrderedDict[str, Any]" = OrderedDict()
+
+    @property
+    def model_name(self) -> str:
+        return getattr(self._llm, "model_name", "")
+
+    @staticmethod
+    def _key(prompt: str) -> str:
+        return hashlib.blake2b(prompt.encode(), digest_size=16).hexdigest()
+
+    def _get(self, key: str) -> Any:
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        expires_at, response = entry
+        if expires_at is not None and expires_at < time.monotonic():
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return response
+
+    def _put(self, key: str, response: Any) -> None:
+        expires_at = time.monotonic() + self._ttl if self._ttl is not None else None
+        self._cache[key] = (expires_at, response)
+        if len(self._cache) > self._maxsize:
+            self._cache.popitem(last=False)
+
+    def invoke(self, input: str, message_history: Any = None, system_instruction: Optional[str] = None) -> Any:
+        if message_history:
+            # Conversational calls are not deterministic per prompt
+            return self._llm.invoke(input, message_history, system_instruction)
+        key = self._key(f"{system_instruction or ''}|{input}")
+        response = self._get(key)
+        if response is None:
+            response = self._llm.invoke(input, system_instruction=system_instruction)
+            self._put(key, response)
+        return response
+
+    async def ainvoke(self, input: str, message_history: Any = None, system_instruction: Optional[str] = None) -> Any:
+        if message_history:
+            return await self._llm.ainvoke(input, message_history, system_instruction)
+        key = self._key(f"{system_instruction or ''}|{input}")
+        response = self._get(key)
+        if response is None:
+            response = await self._llm.ainvoke(input, system_instruction=system_instruction)
+            self._put(key, response)
+        return response
+
+
 class GraphRetrieverManager:
     """
     Manager class for different retrieval strategies.
     """
-    
+
     def __init__(
         self,
         driver: Driver,
         embedder: Embedder,
         vector_index_name: str = "document_embeddings",
         fulltext_index_name: str = "document_fulltext",
+        neo4j_database: Optional[str] = None,
     ):
         """
         Initialize the retriever manager.
-        
+
         Args:
             driver: Neo4j driver instance
             embedder: Embedder for converting text to vectors
             vector_index_name: Name of the vector index
             fulltext_index_name: Name of the fulltext index
+            neo4j_database: Name of the Neo4j database; always set this in
+                production — when omitted, every query pays an extra
+                round-trip to resolve the server's default database
         """
         self.driver = driver
+        self.neo4j_database = neo4j_database
+        # Every retriever built by this manager shares one query-embedding
+        # cache, so repeated questions only hit the embedding API once
+        if not isinstance(embedder, _CachingEmbedder):
+            embedder = _CachingEmbedder(embedder)
         self.embedder = embedder
         self.vector_index_name = vector_index_name
         self.fulltext_index_name = fulltext_index_name
+        # Text2Cypher retrievers are memoized per (llm, schema, examples);
+        # see get_text2cypher_retriever
+        self._text2cypher_cache: Dict[Any, Text2CypherRetriever] = {}
+        # Filtered-search retrievers are memoized per (type, condition
+        # string); the condition space is bounded by filter structures, so
+        # repeated searches reuse the retriever and its compiled query
+        self._filtered_retriever_cache: Dict[Any, Any] = {}
     
     def get_vector_retriever(
         self,
@@ -72,6 +210,7 @@ class GraphRetrieverManager:
             index_name=self.vector_index_name,
             embedder=self.embedder,
             return_properties=return_properties,
+            neo4j_database=self.neo4j_database,
         )
     
     def get_vector_cypher_retriever(
@@ -114,6 +253,7 @@ class GraphRetrieverManager:
             embedder=self.embedder,
             retrieval_query=retrieval_query,
             result_formatter=result_formatter,
+            neo4j_database=self.neo4j_database,
         )
     
     def get_hybrid_retriever(
@@ -142,6 +282,7 @@ class GraphRetrieverManager:
             fulltext_index_name=self.fulltext_index_name,
             embedder=self.embedder,
             return_properties=return_properties,
+            neo4j_database=self.neo4j_database,
         )
     
     def get_hybrid_cypher_retriever(
@@ -166,6 +307,7 @@ class GraphRetrieverManager:
             embedder=self.embedder,
             retrieval_query=retrieval_query,
             result_formatter=result_formatter,
+            neo4j_database=self.neo4j_database,
         )
     
     def get_text2cypher_retriever(
@@ -209,12 +351,22 @@ class GraphRetrieverManager:
             
             results = retriever.search(query_text="Who are the employees of Google?")
         """
-        return Text2CypherRetriever(
-            driver=self.driver,
-            llm=llm,
-            neo4j_schema=neo4j_schema,
-            examples=examples,
-        )
+        # The retriever is stateless apart from its construction arguments,
+        # so reuse one instance per (llm, schema, examples) combination
+        cache_key = (id(llm), neo4j_schema, tuple(examples) if examples else None)
+        retriever = self._text2cypher_cache.get(cache_key)
+        if retriever is None:
+            retriever = Text2CypherRetriever(
+                driver=self.driver,
+                # Memoize Cypher generation per prompt; repeated questions
+                # skip the LLM and only re-run the generated query
+                llm=_MemoizingLLM(llm),
+                neo4j_schema=neo4j_schema,
+                examples=examples,
+                neo4j_database=self.neo4j_database,
+            )
+            self._text2cypher_cache[cache_key] = retriever
+        return retriever
     
     def search_with_filters(
         self,
@@ -264,18 +416,48 @@ class GraphRetrieverManager:
                     {"category": "ML"}
                 ]
             }
+
+        Note:
+            Filters are applied as a parameterized WHERE clause on the
+            index candidates (post-filtering), so highly selective filters
+            may return fewer than top_k items. In exchange, repeated
+            searches with the same filter shape reuse one compiled query
+            string and one Neo4j plan-cache entry, with only the values
+            changing as parameters.
         """
-        if retriever_type == "vector":
-            retriever = self.get_vector_retriever()
-        elif retriever_type == "hybrid":
-            retriever = self.get_hybrid_retriever()
-        else:
-            raise ValueError(f"Unsupported retriever type: {retriever_type}")
-        
+        if not filters:
+            if retriever_type == "vector":
+                retriever = self.get_vector_retriever()
+            elif retriever_type == "hybrid":
+                retriever = self.get_hybrid_retriever()
+            else:
+                raise ValueError(f"Unsupported retriever type: {retriever_type}")
+            return retriever.search(query_text=query_text, top_k=top_k)
+
+        condition, params = compile_filters(filters)
+        cache_key = (retriever_type, condition)
+        retriever = self._filtered_retriever_cache.get(cache_key)
+        if retriever is None:
+            retrieval_query = (
+                f"WITH node, score WHERE {condition}\n"
+                "RETURN node {.*, embedding: null} AS node, score"
+            )
+            if retriever_type == "vector":
+                retriever = self.get_vector_cypher_retriever(
+                    retrieval_query=retrieval_query
+                )
+            elif retriever_type == "hybrid":
+                retriever = self.get_hybrid_cypher_retriever(
+                    retrieval_query=retrieval_query
+                )
+            else:
+                raise ValueError(f"Unsupported retriever type: {retriever_type}")
+            self._filtered_retriever_cache[cache_key] = retriever
+
         return retriever.search(
             query_text=query_text,
             top_k=top_k,
-            filters=filters
+            query_params=params,
         )
 
 
@@ -400,7 +582,10 @@ class ExternalVectorRetrieverManager:
 
 
 # Common retrieval query templates
-RETRIEVAL_QUERY_TEMPLATES = {
+# Frozen: Neo4j caches execution plans by the literal query text, so these
+# strings must stay byte-identical across calls. Extra conditions belong in
+# $parameters via build_retrieval_query, never interpolated into the string.
+RETRIEVAL_QUERY_TEMPLATES = MappingProxyType({
     "entity_context": """
         OPTIONAL MATCH (node)-[:HAS_ENTITY]->(entity:__Entity__)
         RETURN node.text as text,
@@ -437,7 +622,171 @@ RETRIEVAL_QUERY_TEMPLATES = {
                next.text as next_chunk,
                score
     """,
-}
+})
+
+
+@lru_cache(maxsize=64)
+def _compose_retrieval_query(template_key: str, keys: tuple) -> str:
+    # Cached so each (template, condition-keys) combination always yields
+    # the identical string — one Neo4j plan-cache entry per combination
+    conditions = " AND ".join(
+        f"node.{key} = $rq_{index}" for index, key in enumerate(keys)
+    )
+    return f"WITH node, score WHERE {conditions}\n{RETRIEVAL_QUERY_TEMPLATES[template_key]}"
+
+
+def build_retrieval_query(
+    template_key: str,
+    extra_where: Optional[Dict[str, Any]] = None,
+) -> tuple:
+    """
+    Compose a retrieval query from a template plus parameterized conditions.
+
+    Values are always passed as query parameters, never interpolated into
+    the Cypher text, so the composed string depends only on the template
+    and the condition keys and Neo4j's plan cache keeps hitting.
+
+    Args:
+        template_key: Key into RETRIEVAL_QUERY_TEMPLATES
+        extra_where: Optional node-property equality conditions
+
+    Returns:
+        (retrieval_query, query_params) tuple
+
+    Example:
+        query, params = build_retrieval_query(
+            "entity_context", {"source": "business_example"}
+        )
+        retriever = manager.get_vector_cypher_retriever(retrieval_query=query)
+        retriever.search(query_text="...", query_params=params)
+    """
+    if not extra_where:
+        return RETRIEVAL_QUERY_TEMPLATES[template_key], {}
+    keys = tuple(sorted(extra_where))
+    for key in keys:
+        if not key.isidentifier():
+            raise ValueError(f"Invalid property name in extra_where: {key!r}")
+    params = {f"rq_{index}": extra_where[key] for index, key in enumerate(keys)}
+    return _compose_retrieval_query(template_key, keys), params
+
+
+# Operators shared by the filter compiler below
+_COMPARISON_OPS = MappingProxyType({
+    "$eq": "=",
+    "$ne": "<>",
+    "$gt": ">",
+    "$gte": ">=",
+    "$lt": "<",
+    "$lte": "<=",
+})
+
+
+def _filter_structure(filters: Dict[str, Any]) -> tuple:
+    """Canonical, hashable key for a filter's shape: operators and property
+    names only, with values stripped."""
+    items = []
+    for key in sorted(filters):
+        value = filters[key]
+        if key == "$or":
+            items.append(("$or", tuple(_filter_structure(sub) for sub in value)))
+            continue
+        if not key.isidentifier():
+            raise ValueError(f"Invalid property name in filters: {key!r}")
+        if isinstance(value, dict):
+            items.append((key, tuple(sorted(value))))
+        else:
+            items.append((key, "$eq"))
+    return tuple(items)
+
+
+@lru_cache(maxsize=128)
+def _compile_filter_structure(structure: tuple) -> str:
+    counter = itertools.count()
+
+    def emit(struct: tuple) -> str:
+        parts = []
+        for key, spec in struct:
+            if key == "$or":
+                parts.append("(" + " OR ".join(emit(sub) for sub in spec) + ")")
+                continue
+            if spec == "$eq":
+                parts.append(f"node.{key} = $fp_{next(counter)}")
+                continue
+            conditions = []
+            for op in spec:
+                if op == "$in":
+                    conditions.append(f"node.{key} IN $fp_{next(counter)}")
+                elif op == "$like":
+                    conditions.append(f"node.{key} CONTAINS $fp_{next(counter)}")
+                elif op == "$between":
+                    low, high = next(counter), next(counter)
+                    conditions.append(
+                        f"($fp_{low} <= node.{key} AND node.{key} <= $fp_{high})"
+                    )
+                elif op in _COMPARISON_OPS:
+                    conditions.append(
+                        f"node.{key} {_COMPARISON_OPS[op]} $fp_{next(counter)}"
+                    )
+                else:
+                    raise ValueError(f"Unsupported filter operator: {op}")
+            parts.append(" AND ".join(conditions))
+        return " AND ".join(parts)
+
+    return emit(structure)
+
+
+def _filter_params(
+    filters: Dict[str, Any],
+    counter: Optional[Any] = None,
+    params: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    # Walks in the same deterministic order as _compile_filter_structure so
+    # values line up with the placeholders the compile step emitted
+    if params is None:
+        counter = itertools.count()
+        params = {}
+    for key in sorted(filters):
+        value = filters[key]
+        if key == "$or":
+            for sub in value:
+                _filter_params(sub, counter, params)
+        elif isinstance(value, dict):
+            for op in sorted(value):
+                if op == "$between":
+                    params[f"fp_{next(counter)}"] = value[op][0]
+                    params[f"fp_{next(counter)}"] = value[op][1]
+                else:
+                    params[f"fp_{next(counter)}"] = value[op]
+        else:
+            params[f"fp_{next(counter)}"] = value
+    return params
+
+
+def compile_filters(filters: Dict[str, Any]) -> tuple:
+    """
+    Compile a metadata filter dict to a parameterized Cypher condition.
+
+    The condition string depends only on the filter's structure (operators
+    and property names), so repeated searches that vary only in values —
+    a dashboard refreshing a date range, say — reuse one cached compile
+    and keep hitting a single Neo4j plan-cache entry while the values
+    travel as query parameters.
+
+    Supports the operator subset documented on search_with_filters; the
+    matched node is referenced as `node`, matching the retrieval query
+    templates above.
+
+    Args:
+        filters: Filter dictionary (see search_with_filters for syntax)
+
+    Returns:
+        (condition_cypher, query_params) tuple
+
+    Example:
+        condition, params = compile_filters({"year": {"$gte": 2020}})
+        # condition == "node.year >= $fp_0", params == {"fp_0": 2020}
+    """
+    return _compile_filter_structure(_filter_structure(filters)), _filter_params(filters)
 
 
 def create_result_formatter(fields: List[str]) -> callable:
@@ -456,21 +805,49 @@ def create_result_formatter(fields: List[str]) -> callable:
         # This creates a formatter that generates content like:
         # "Text: ..., Entities: [...], Document: ..."
     """
+    # Bind the field list once at closure creation; the per-record hot path
+    # then makes a single pass and joins a generator, with no scratch list
+    fields_t = tuple(fields)
+
     def formatter(record: neo4j.Record) -> RetrieverResultItem:
-        content_parts = []
         metadata = {"score": record.get("score")}
-        
-        for field in fields:
+        for field in fields_t:
             value = record.get(field)
             if value is not None:
-                content_parts.append(f"{field}: {value}")
                 metadata[field] = value
-        
-        content = ", ".join(content_parts)
-        
+        content = ", ".join(
+            f"{field}: {metadata[field]}" for field in fields_t if field in metadata
+        )
         return RetrieverResultItem(
             content=content,
             metadata=metadata
         )
-    
+
     return formatter
+
+
+def _record_score(record: Any) -> float:
+    score = record.get("score")
+    return score if score is not None else 0.0
+
+
+def format_top_k(records: Any, k: int, formatter: callable) -> List[RetrieverResultItem]:
+    """
+    Format only the k highest-scoring records.
+
+    Uses heapq.nlargest, which is O(n log k) rather than the O(n log n) of
+    sorting everything and slicing — a real saving when keeping a handful
+    of results out of hundreds of vector-search candidates.
+
+    Args:
+        records: Iterable of records with a "score" field
+        k: Number of top records to keep
+        formatter: Per-record formatter, e.g. from create_result_formatter
+
+    Returns:
+        Formatted items for the top k records, highest score first
+    """
+    return [
+        formatter(record)
+        for record in heapq.nlargest(k, records, key=_record_score)
+    ]
@@ -12,24 +12,83 @@ sys.path.insert(0, str(Path(__file__).parent))
 from config import Config
 from utils import SetupHelper, DatabaseUtils
 
+# Banner and help blobs built once at import instead of per call
+_BAR = "=" * 80
+
+_DOCKER_HELP = (
+    "\n\n   Example Docker command to run Neo4j with APOC:"
+    "\ndocker run --name neo4j-container-1 \\ "
+    "\n  -p 7474:7474 \\ "
+    "\n  -p 7687:7687 \\ "
+    "\n  -v $HOME/neo4j/container-1/data:/data \\ "
+    "\n  -e NEO4J_AUTH=neo4j/password \\ "
+    "\n  -e NEO4J_apoc_export_file_enabled=true \\ "
+    "\n  -e NEO4J_apoc_import_file_enabled=true \\ "
+    "\n  -e NEO4J_apoc_import_file_use__neo4j__config=true \\ "
+    "\n  -e NEO4J_PLUGINS=\\[\\\"apoc\\\"\\] \\ "
+    "\n  neo4j "
+)
+
+# One table drives the provider configuration check, the remediation hint,
+# and the "other available providers" listing: display name, required Config
+# attributes, and the .env fix hint
+_PROVIDERS = {
+    "openai": (
+        "OpenAI",
+        ("OPENAI_API_KEY",),
+        "Set OPENAI_API_KEY in your .env file",
+    ),
+    "anthropic": (
+        "Anthropic",
+        ("ANTHROPIC_API_KEY",),
+        "Set ANTHROPIC_API_KEY in your .env file",
+    ),
+    "cohere": (
+        "Cohere",
+        ("CO_API_KEY",),
+        "Set CO_API_KEY in your .env file",
+    ),
+    "mistral": (
+        "MistralAI",
+        ("MISTRAL_API_KEY",),
+        "Set MISTRAL_API_KEY in your .env file",
+    ),
+    "azure_openai": (
+        "Azure OpenAI",
+        ("AZURE_OPENAI_API_KEY", "AZURE_OPENAI_ENDPOINT"),
+        "Set AZURE_OPENAI_API_KEY and AZURE_OPENAI_ENDPOINT in your .env file",
+    ),
+    "vertexai": (
+        "VertexAI",
+        ("GOOGLE_APPLICATION_CREDENTIALS", "GOOGLE_CLOUD_PROJECT"),
+        "Set GOOGLE_APPLICATION_CREDENTIALS and GOOGLE_CLOUD_PROJECT in your .env file",
+    ),
+    "ollama": (
+        "Ollama",
+        (),
+        "Make sure Ollama is running locally",
+    ),
+}
+
 
 def check_environment():
     """Check if environment is properly configured."""
     
-    print("=" * 80)
-    print("Neo4j GraphRAG - Environment Check")
-    print("=" * 80)
-    
+    # Consecutive lines go out in one buffered write instead of a print
+    # (lock + flush) per line; output is only split around helper calls
+    # that print on their own
+    print(
+        _BAR
+        + "\nNeo4j GraphRAG - Environment Check\n"
+        + _BAR
+        + "\n\n1. Checking Neo4j Configuration..."
+        + f"\n   URI: {Config.NEO4J_URI}"
+        + f"\n   Username: {Config.NEO4J_USERNAME}"
+        + f"\n   Database: {Config.NEO4J_DATABASE}"
+        + "\n\n2. Testing Neo4j Connection..."
+    )
+
     issues = []
-    
-    # Check Neo4j configuration
-    print("\n1. Checking Neo4j Configuration...")
-    print(f"   URI: {Config.NEO4J_URI}")
-    print(f"   Username: {Config.NEO4J_USERNAME}")
-    print(f"   Database: {Config.NEO4J_DATABASE}")
-    
-    # Test Neo4j connection
-    print("\n2. Testing Neo4j Connection...")
     connection_successful = SetupHelper.verify_connection(
         uri=Config.NEO4J_URI,
         username=Config.NEO4J_USERNAME,
@@ -41,151 +100,109 @@ def check_environment():
         
         # Check APOC installation
         print("\n   Checking APOC plugin...")
+        # Shared singleton driver; closed automatically at exit
         driver = Config.get_neo4j_driver()
         apoc_installed = SetupHelper.check_apoc_installed(driver)
-        driver.close()
         
         if not apoc_installed:
             issues.append("APOC plugin not installed")
-            print("\n   ⚠️  APOC plugin is REQUIRED for GraphRAG")
-            print("\n   Install APOC:")
-            print("   - Neo4j Desktop: Go to your database → Plugins → Install APOC")
-            print("   - Neo4j Aura: APOC is pre-installed (restart if just created)")
-            print("   - Docker: Use neo4j:latest or add NEO4J_PLUGINS=[\"apoc\"]")
-            print("   - Manual: Download from https://neo4j.com/labs/apoc/")
-            print("\n   After installing APOC, restart Neo4j and run this check again.")
+            print(
+                "\n   ⚠️  APOC plugin is REQUIRED for GraphRAG"
+                "\n\n   Install APOC:"
+                "\n   - Neo4j Desktop: Go to your database → Plugins → Install APOC"
+                "\n   - Neo4j Aura: APOC is pre-installed (restart if just created)"
+                "\n   - Docker: Use neo4j:latest or add NEO4J_PLUGINS=[\"apoc\"]"
+                "\n   - Manual: Download from https://neo4j.com/labs/apoc/"
+                "\n\n   After installing APOC, restart Neo4j and run this check again."
+            )
     else:
         issues.append("Neo4j connection failed")
-        print("   ✗ Neo4j connection failed")
-        print("\n   Troubleshooting:")
-        print("   - Make sure Neo4j is running")
-        print("   - Check your .env file for correct credentials")
-        print("   - Verify NEO4J_URI, NEO4J_USERNAME, and NEO4J_PASSWORD")
-        print("\n   Example Docker command to run Neo4j with APOC:")
-        print("docker run --name neo4j-container-1 \\ ")
-        print("  -p 7474:7474 \\ ")
-        print("  -p 7687:7687 \\ ")
-        print("  -v $HOME/neo4j/container-1/data:/data \\ ")
-        print("  -e NEO4J_AUTH=neo4j/password \\ ")
-        print("  -e NEO4J_apoc_export_file_enabled=true \\ ")
-        print("  -e NEO4J_apoc_import_file_enabled=true \\ ")
-        print("  -e NEO4J_apoc_import_file_use__neo4j__config=true \\ ")
-        print("  -e NEO4J_PLUGINS=\\[\\\"apoc\\\"\\] \\ ")
-        print("  neo4j ")
+        print(
+            "   ✗ Neo4j connection failed"
+            "\n\n   Troubleshooting:"
+            "\n   - Make sure Neo4j is running"
+            "\n   - Check your .env file for correct credentials"
+            "\n   - Verify NEO4J_URI, NEO4J_USERNAME, and NEO4J_PASSWORD"
+            + _DOCKER_HELP
+        )
     
     # Check LLM API Keys
     print("\n3. Checking LLM Configuration...")
     print(f"   Selected Provider: {Config.LLM_PROVIDER}")
     
-    provider = Config.LLM_PROVIDER.lower()
+    provider = Config.provider()
+    spec = _PROVIDERS.get(provider)
     provider_configured = False
-    
-    if provider == "openai":
-        if Config.OPENAI_API_KEY:
-            print("   ✓ OpenAI API key configured")
-            provider_configured = True
-        else:
-            print("   ✗ OpenAI API key missing")
-    elif provider == "anthropic":
-        if Config.ANTHROPIC_API_KEY:
-            print("   ✓ Anthropic API key configured")
-            provider_configured = True
-        else:
-            print("   ✗ Anthropic API key missing")
-    elif provider == "cohere":
-        if Config.CO_API_KEY:
-            print("   ✓ Cohere API key configured")
-            provider_configured = True
-        else:
-            print("   ✗ Cohere API key missing")
-    elif provider == "mistral":
-        if Config.MISTRAL_API_KEY:
-            print("   ✓ MistralAI API key configured")
-            provider_configured = True
-        else:
-            print("   ✗ MistralAI API key missing")
-    elif provider == "azure_openai":
-        if Config.AZURE_OPENAI_API_KEY and Config.AZURE_OPENAI_ENDPOINT:
-            print("   ✓ Azure OpenAI configured")
+
+    if spec is None:
+        print(f"   ✗ Unknown provider: {provider}")
+    else:
+        name, required, _ = spec
+        if not required:
+            print(f"   ✓ {name} selected (no API key needed)")
             provider_configured = True
-        else:
-            print("   ✗ Azure OpenAI API key or endpoint missing")
-    elif provider == "vertexai":
-        if Config.GOOGLE_APPLICATION_CREDENTIALS and Config.GOOGLE_CLOUD_PROJECT:
-            print("   ✓ VertexAI configured")
+        elif all(getattr(Config, attr) for attr in required):
+            print(f"   ✓ {name} configured")
             provider_configured = True
         else:
-            print("   ✗ VertexAI credentials or project missing")
-    elif provider == "ollama":
-        print("   ✓ Ollama selected (no API key needed)")
-        provider_configured = True
-    else:
-        print(f"   ✗ Unknown provider: {provider}")
-    
+            print(f"   ✗ {name} credentials missing")
+
     if not provider_configured:
         issues.append(f"LLM provider '{Config.LLM_PROVIDER}' not properly configured")
         print(f"\n   To configure {Config.LLM_PROVIDER}:")
-        if provider == "openai":
-            print("   - Set OPENAI_API_KEY in your .env file")
-        elif provider == "anthropic":
-            print("   - Set ANTHROPIC_API_KEY in your .env file")
-        elif provider == "cohere":
-            print("   - Set CO_API_KEY in your .env file")
-        elif provider == "mistral":
-            print("   - Set MISTRAL_API_KEY in your .env file")
-        elif provider == "azure_openai":
-            print("   - Set AZURE_OPENAI_API_KEY and AZURE_OPENAI_ENDPOINT in your .env file")
-        elif provider == "vertexai":
-            print("   - Set GOOGLE_APPLICATION_CREDENTIALS and GOOGLE_CLOUD_PROJECT in your .env file")
-        elif provider == "ollama":
-            print("   - Make sure Ollama is running locally")
-    
+        if spec is not None:
+            print(f"   - {spec[2]}")
+
     # Check other available providers
-    other_providers = []
-    if Config.OPENAI_API_KEY and provider != "openai":
-        other_providers.append("OpenAI")
-    if Config.ANTHROPIC_API_KEY and provider != "anthropic":
-        other_providers.append("Anthropic")
-    if Config.CO_API_KEY and provider != "cohere":
-        other_providers.append("Cohere")
-    if Config.MISTRAL_API_KEY and provider != "mistral":
-        other_providers.append("MistralAI")
-    if Config.AZURE_OPENAI_API_KEY and provider != "azure_openai":
-        other_providers.append("Azure OpenAI")
-    
+    other_providers = [
+        name
+        for key, (name, required, _) in _PROVIDERS.items()
+        if key != provider
+        and required
+        and all(getattr(Config, attr) for attr in required)
+    ]
+
     if other_providers:
-        print(f"   ℹ️  Other available providers: {', '.join(other_providers)}")
-        print("      You can change LLM_PROVIDER in your .env file to switch providers")
-    
+        print(
+            f"   ℹ️  Other available providers: {', '.join(other_providers)}"
+            "\n      You can change LLM_PROVIDER in your .env file to switch providers"
+        )
+
     # Check Ollama (optional)
-    print("\n4. Checking Ollama (optional local LLM)...")
-    print(f"   Host: {Config.OLLAMA_HOST}")
-    print("   ℹ️  Ollama is optional for running local models")
-    
+    print(
+        "\n4. Checking Ollama (optional local LLM)..."
+        f"\n   Host: {Config.OLLAMA_HOST}"
+        "\n   ℹ️  Ollama is optional for running local models"
+    )
+
     # Summary
-    print("\n" + "=" * 80)
     if issues:
-        print("❌ SETUP INCOMPLETE")
-        print("=" * 80)
-        print("\nIssues found:")
-        for issue in issues:
-            print(f"  - {issue}")
-        print("\nPlease fix the issues above before running the examples.")
-        print("\nQuick fix:")
-        print("1. Copy .env.example to .env")
-        print("2. Edit .env and add your credentials:")
-        print("   - NEO4J_PASSWORD=your_neo4j_password")
-        print("   - OPENAI_API_KEY=your_openai_key")
-        print("3. Make sure Neo4j is running")
+        print(
+            "\n" + _BAR
+            + "\n❌ SETUP INCOMPLETE\n"
+            + _BAR
+            + "\n\nIssues found:\n"
+            + "\n".join(f"  - {issue}" for issue in issues)
+            + "\n\nPlease fix the issues above before running the examples."
+            + "\n\nQuick fix:"
+            + "\n1. Copy .env.example to .env"
+            + "\n2. Edit .env and add your credentials:"
+            + "\n   - NEO4J_PASSWORD=your_neo4j_password"
+            + "\n   - OPENAI_API_KEY=your_openai_key"
+            + "\n3. Make sure Neo4j is running"
+        )
         return False
     else:
-        print("✅ SETUP COMPLETE")
-        print("=" * 80)
-        print("\nYour environment is properly configured!")
-        print("\nNext steps:")
-        print("1. Run: python examples/example_kg_builder.py")
-        print("2. Then: python examples/example_rag_query.py")
-        print("3. View your graph at: http://localhost:7474")
+        print(
+            "\n" + _BAR
+            + "\n✅ SETUP COMPLETE\n"
+            + _BAR
+            + "\n\nYour environment is properly configured!"
+            + "\n\nNext steps:"
+            + "\n1. Run: python examples/example_kg_builder.py"
+            + "\n2. Then: python examples/example_rag_query.py"
+            + "\n3. View your graph at: http://localhost:7474"
+        )
         return True
 
 
@@ -195,24 +212,24 @@ def check_database_status():
         driver = Config.get_neo4j_driver()
         
         print("\n5. Checking Database Status...")
-        
-        # Get database info
-        summary = DatabaseUtils.get_schema_summary(driver)
-        
-        total_nodes = sum(summary["nodes_per_label"].values())
-        total_rels = sum(summary["relationships_per_type"].values())
-        
-        if total_nodes == 0:
+
+        # LIMIT-1 existence probe first: on an empty database this is one
+        # round-trip and the full schema summary is skipped entirely
+        if not DatabaseUtils.has_any_nodes(driver):
             print("   ℹ️  Database is empty (ready for new data)")
-        else:
-            print(f"   ℹ️  Database contains:")
-            print(f"      - {total_nodes:,} nodes")
-            print(f"      - {total_rels:,} relationships")
-            print(f"      - {summary['label_count']} node labels")
-            print(f"      - {summary['relationship_type_count']} relationship types")
-        
-        driver.close()
-        
+            return
+
+        # Totals come straight from the count store; the per-label
+        # breakdown is not displayed here, so skip the full summary
+        total_nodes, total_rels = DatabaseUtils.get_totals(driver)
+        labels, rel_types = DatabaseUtils._get_schema_names(driver)
+
+        print(f"   ℹ️  Database contains:")
+        print(f"      - {total_nodes:,} nodes")
+        print(f"      - {total_rels:,} relationships")
+        print(f"      - {len(labels)} node labels")
+        print(f"      - {len(rel_types)} relationship types")
+
     except Exception as e:
         print(f"   ⚠️  Could not check database status: {e}")
 
@@ -225,4 +242,4 @@ if __name__ == "__main__":
     if success:
         check_database_status()
     
-    print("\n" + "=" * 80)
+    print("\n" + _BAR)